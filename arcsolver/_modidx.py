@@ -47,6 +47,15 @@ d = { 'settings': { 'branch': 'main',
                                'arcsolver.ocm.Color.__init__': ('ocm.html#color.__init__', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Color.__str__': ('ocm.html#color.__str__', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Color.to_array': ('ocm.html#color.to_array', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ComponentCache': ('ocm.html#componentcache', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ComponentCache.__init__': ('ocm.html#componentcache.__init__', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ComponentCache._label': ('ocm.html#componentcache._label', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ComponentCache.components': ('ocm.html#componentcache.components', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ComponentCache.fingerprint': ('ocm.html#componentcache.fingerprint', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Components': ('ocm.html#components', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Components.__len__': ('ocm.html#components.__len__', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Components.bbox_slice': ('ocm.html#components.bbox_slice', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Components.mask': ('ocm.html#components.mask', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.CyclicPattern': ('ocm.html#cyclicpattern', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.CyclicPattern.__len__': ('ocm.html#cyclicpattern.__len__', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.CyclicPattern.extend': ('ocm.html#cyclicpattern.extend', 'arcsolver/ocm.py'),
@@ -69,21 +78,47 @@ d = { 'settings': { 'branch': 'main',
                                'arcsolver.ocm.Object': ('ocm.html#object', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Object._get_shape_array': ('ocm.html#object._get_shape_array', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Object.to_array': ('ocm.html#object.to_array', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternIndex': ('ocm.html#patternindex', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternIndex.__init__': ('ocm.html#patternindex.__init__', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternIndex._variant_groups': ('ocm.html#patternindex._variant_groups', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternIndex.find_matches': ('ocm.html#patternindex.find_matches', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternIndex.transform': ('ocm.html#patternindex.transform', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternMatch': ('ocm.html#patternmatch', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.PatternMatcher': ('ocm.html#patternmatcher', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternMatcher._match_counts': ('ocm.html#patternmatcher._match_counts', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternMatcher._to_matches': ('ocm.html#patternmatcher._to_matches', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.PatternMatcher.extract_matching_region': ( 'ocm.html#patternmatcher.extract_matching_region',
                                                                                          'arcsolver/ocm.py'),
                                'arcsolver.ocm.PatternMatcher.find_best_match': ( 'ocm.html#patternmatcher.find_best_match',
                                                                                  'arcsolver/ocm.py'),
                                'arcsolver.ocm.PatternMatcher.find_matches': ('ocm.html#patternmatcher.find_matches', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.PatternMatcher.find_matches_batch': ( 'ocm.html#patternmatcher.find_matches_batch',
+                                                                                    'arcsolver/ocm.py'),
                                'arcsolver.ocm.Rectangle': ('ocm.html#rectangle', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Rectangle._get_shape_array': ('ocm.html#rectangle._get_shape_array', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region': ('ocm.html#region', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.__init__': ('ocm.html#region.__init__', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.__repr__': ('ocm.html#region.__repr__', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.color': ('ocm.html#region.color', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.data': ('ocm.html#region.data', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.labels': ('ocm.html#region.labels', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.mask': ('ocm.html#region.mask', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.position': ('ocm.html#region.position', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.size': ('ocm.html#region.size', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.to_bitmap': ('ocm.html#region.to_bitmap', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.Region.values': ('ocm.html#region.values', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.ShapeExtractor': ('ocm.html#shapeextractor', 'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ShapeExtractor._label_components': ( 'ocm.html#shapeextractor._label_components',
+                                                                                   'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ShapeExtractor._region_order': ('ocm.html#shapeextractor._region_order', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.ShapeExtractor.extract_all_shapes': ( 'ocm.html#shapeextractor.extract_all_shapes',
                                                                                     'arcsolver/ocm.py'),
                                'arcsolver.ocm.ShapeExtractor.extract_contiguous_regions': ( 'ocm.html#shapeextractor.extract_contiguous_regions',
                                                                                             'arcsolver/ocm.py'),
                                'arcsolver.ocm.ShapeExtractor.extract_largest_shape': ( 'ocm.html#shapeextractor.extract_largest_shape',
                                                                                        'arcsolver/ocm.py'),
+                               'arcsolver.ocm.ShapeExtractor.label_components': ( 'ocm.html#shapeextractor.label_components',
+                                                                                  'arcsolver/ocm.py'),
                                'arcsolver.ocm.Vector': ('ocm.html#vector', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Vector.__add__': ('ocm.html#vector.__add__', 'arcsolver/ocm.py'),
                                'arcsolver.ocm.Vector.__init__': ('ocm.html#vector.__init__', 'arcsolver/ocm.py'),
@@ -96,13 +131,17 @@ d = { 'settings': { 'branch': 'main',
             'arcsolver.score': {'arcsolver.score.score': ('score.html#score', 'arcsolver/score.py')},
             'arcsolver.solve': { 'arcsolver.solve.ArcSolver': ('solve.html#arcsolver', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ArcSolver.__init__': ('solve.html#arcsolver.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ArcSolver._can_spend': ('solve.html#arcsolver._can_spend', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ArcSolver._collect_attempts': ( 'solve.html#arcsolver._collect_attempts',
                                                                                   'arcsolver/solve.py'),
                                  'arcsolver.solve.ArcSolver._count_attempts': ( 'solve.html#arcsolver._count_attempts',
                                                                                 'arcsolver/solve.py'),
                                  'arcsolver.solve.ArcSolver._get_best_n': ('solve.html#arcsolver._get_best_n', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ArcSolver._log_progress': ('solve.html#arcsolver._log_progress', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ArcSolver._next_parent': ('solve.html#arcsolver._next_parent', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ArcSolver._run_attempt': ('solve.html#arcsolver._run_attempt', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ArcSolver.solve': ('solve.html#arcsolver.solve', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ArcSolver.solve_many': ('solve.html#arcsolver.solve_many', 'arcsolver/solve.py'),
                                  'arcsolver.solve.AsyncChat.codeloop': ('solve.html#asyncchat.codeloop', 'arcsolver/solve.py'),
                                  'arcsolver.solve.Attempt': ('solve.html#attempt', 'arcsolver/solve.py'),
                                  'arcsolver.solve.Attempt.score': ('solve.html#attempt.score', 'arcsolver/solve.py'),
@@ -113,11 +152,68 @@ d = { 'settings': { 'branch': 'main',
                                  'arcsolver.solve.ConcurrentExecutor': ('solve.html#concurrentexecutor', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ConcurrentExecutor.__init__': ( 'solve.html#concurrentexecutor.__init__',
                                                                                   'arcsolver/solve.py'),
+                                 'arcsolver.solve.ConcurrentExecutor._run': ('solve.html#concurrentexecutor._run', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ConcurrentExecutor.cancel': ( 'solve.html#concurrentexecutor.cancel',
+                                                                                'arcsolver/solve.py'),
+                                 'arcsolver.solve.ConcurrentExecutor.close': ('solve.html#concurrentexecutor.close', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ConcurrentExecutor.run_attempts': ( 'solve.html#concurrentexecutor.run_attempts',
                                                                                       'arcsolver/solve.py'),
+                                 'arcsolver.solve.ConcurrentExecutor.shared': ( 'solve.html#concurrentexecutor.shared',
+                                                                                'arcsolver/solve.py'),
+                                 'arcsolver.solve.ConcurrentExecutor.submit': ( 'solve.html#concurrentexecutor.submit',
+                                                                                'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache': ('solve.html#executioncache', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.__init__': ('solve.html#executioncache.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.__len__': ('solve.html#executioncache.__len__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.__repr__': ('solve.html#executioncache.__repr__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache._code_hash': ( 'solve.html#executioncache._code_hash',
+                                                                                'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache._grids_hash': ( 'solve.html#executioncache._grids_hash',
+                                                                                 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache._has_traceback': ( 'solve.html#executioncache._has_traceback',
+                                                                                    'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.clear': ('solve.html#executioncache.clear', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.get': ('solve.html#executioncache.get', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.hit_rate': ('solve.html#executioncache.hit_rate', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.key': ('solve.html#executioncache.key', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionCache.put': ('solve.html#executioncache.put', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionLimits': ('solve.html#executionlimits', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ExecutionResult': ('solve.html#executionresult', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ExecutionResult.run_time': ('solve.html#executionresult.run_time', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer': ('solve.html#forkserver', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer.__init__': ('solve.html#forkserver.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer._cancel': ('solve.html#forkserver._cancel', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer._read_results': ('solve.html#forkserver._read_results', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer.close': ('solve.html#forkserver.close', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer.run': ('solve.html#forkserver.run', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.ForkServer.start': ('solve.html#forkserver.start', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.HistoryIndex': ('solve.html#historyindex', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.HistoryIndex.copy': ('solve.html#historyindex.copy', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.HistoryIndex.update': ('solve.html#historyindex.update', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxJob': ('solve.html#sandboxjob', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxJob.__init__': ('solve.html#sandboxjob.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxJob.attach': ('solve.html#sandboxjob.attach', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxJob.cancel': ('solve.html#sandboxjob.cancel', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxWorker': ('solve.html#sandboxworker', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxWorker.__init__': ('solve.html#sandboxworker.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxWorker.close': ('solve.html#sandboxworker.close', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxWorker.run': ('solve.html#sandboxworker.run', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxWorker.start': ('solve.html#sandboxworker.start', 'arcsolver/solve.py'),
                                  'arcsolver.solve.SandboxedExecutor': ('solve.html#sandboxedexecutor', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxedExecutor._failed': ( 'solve.html#sandboxedexecutor._failed',
+                                                                                'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxedExecutor._input_data': ( 'solve.html#sandboxedexecutor._input_data',
+                                                                                    'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxedExecutor._parse_result': ( 'solve.html#sandboxedexecutor._parse_result',
+                                                                                      'arcsolver/solve.py'),
+                                 'arcsolver.solve.SandboxedExecutor._timed_out': ( 'solve.html#sandboxedexecutor._timed_out',
+                                                                                   'arcsolver/solve.py'),
                                  'arcsolver.solve.SandboxedExecutor.run': ('solve.html#sandboxedexecutor.run', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SharedGrids': ('solve.html#sharedgrids', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SharedGrids.__init__': ('solve.html#sharedgrids.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SharedGrids._release': ('solve.html#sharedgrids._release', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SharedGrids.close': ('solve.html#sharedgrids.close', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SharedGrids.for_task': ('solve.html#sharedgrids.for_task', 'arcsolver/solve.py'),
                                  'arcsolver.solve.Solution': ('solve.html#solution', 'arcsolver/solve.py'),
                                  'arcsolver.solve.Solution.from_response': ('solve.html#solution.from_response', 'arcsolver/solve.py'),
                                  'arcsolver.solve.Solution.full_code': ('solve.html#solution.full_code', 'arcsolver/solve.py'),
@@ -132,25 +228,44 @@ d = { 'settings': { 'branch': 'main',
                                  'arcsolver.solve.SolutionTree.best_attempt': ( 'solve.html#solutiontree.best_attempt',
                                                                                 'arcsolver/solve.py'),
                                  'arcsolver.solve.SolutionTree.best_score': ('solve.html#solutiontree.best_score', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SolutionTree.cancelled': ('solve.html#solutiontree.cancelled', 'arcsolver/solve.py'),
                                  'arcsolver.solve.SolutionTree.correct': ('solve.html#solutiontree.correct', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SolutionTree.execution_stats': ( 'solve.html#solutiontree.execution_stats',
+                                                                                   'arcsolver/solve.py'),
                                  'arcsolver.solve.SolutionTree.show': ('solve.html#solutiontree.show', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SolutionTree.slowest': ('solve.html#solutiontree.slowest', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SolveLimits': ('solve.html#solvelimits', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SolveLimits.exhausted': ('solve.html#solvelimits.exhausted', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.SolveLimits.spend': ('solve.html#solvelimits.spend', 'arcsolver/solve.py'),
                                  'arcsolver.solve.SolverProgress': ('solve.html#solverprogress', 'arcsolver/solve.py'),
                                  'arcsolver.solve.ValidationError': ('solve.html#validationerror', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.WarmWorkerPool': ('solve.html#warmworkerpool', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.WarmWorkerPool.__init__': ('solve.html#warmworkerpool.__init__', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.WarmWorkerPool.close': ('solve.html#warmworkerpool.close', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.WarmWorkerPool.run': ('solve.html#warmworkerpool.run', 'arcsolver/solve.py'),
                                  'arcsolver.solve._already_shown_task': ('solve.html#_already_shown_task', 'arcsolver/solve.py'),
                                  'arcsolver.solve._image_message': ('solve.html#_image_message', 'arcsolver/solve.py'),
-                                 'arcsolver.solve._run_single_attempt': ('solve.html#_run_single_attempt', 'arcsolver/solve.py'),
+                                 'arcsolver.solve._read_frame': ('solve.html#_read_frame', 'arcsolver/solve.py'),
                                  'arcsolver.solve.attempt_solution': ('solve.html#attempt_solution', 'arcsolver/solve.py'),
                                  'arcsolver.solve.clear_cache': ('solve.html#clear_cache', 'arcsolver/solve.py'),
                                  'arcsolver.solve.feedback': ('solve.html#feedback', 'arcsolver/solve.py'),
                                  'arcsolver.solve.retry_solution': ('solve.html#retry_solution', 'arcsolver/solve.py'),
-                                 'arcsolver.solve.run_solutions': ('solve.html#run_solutions', 'arcsolver/solve.py')},
+                                 'arcsolver.solve.run_solutions': ('solve.html#run_solutions', 'arcsolver/solve.py'),
+                                 'arcsolver.solve.run_solutions_async': ('solve.html#run_solutions_async', 'arcsolver/solve.py')},
             'arcsolver.task': { 'arcsolver.task.ArcGrid': ('task.html#arcgrid', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcGrid.__eq__': ('task.html#arcgrid.__eq__', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid.__hash__': ('task.html#arcgrid.__hash__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcGrid.__init__': ('task.html#arcgrid.__init__', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid.__reduce__': ('task.html#arcgrid.__reduce__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcGrid.__str__': ('task.html#arcgrid.__str__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcGrid._draw_grid': ('task.html#arcgrid._draw_grid', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid._set': ('task.html#arcgrid._set', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcGrid._setup_ax': ('task.html#arcgrid._setup_ax', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid.bytes': ('task.html#arcgrid.bytes', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid.fingerprint': ('task.html#arcgrid.fingerprint', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid.intern': ('task.html#arcgrid.intern', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcGrid.plot': ('task.html#arcgrid.plot', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcGrid.trusted': ('task.html#arcgrid.trusted', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcPair': ('task.html#arcpair', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcPair.__getitem__': ('task.html#arcpair.__getitem__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcPair.__init__': ('task.html#arcpair.__init__', 'arcsolver/task.py'),
@@ -158,14 +273,61 @@ d = { 'settings': { 'branch': 'main',
                                 'arcsolver.task.ArcPair.__len__': ('task.html#arcpair.__len__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcPair.__str__': ('task.html#arcpair.__str__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcPair._create_separator': ('task.html#arcpair._create_separator', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcPair._panels': ('task.html#arcpair._panels', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcPair.plot': ('task.html#arcpair.plot', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcTask': ('task.html#arctask', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcTask.__init__': ('task.html#arctask.__init__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcTask.__str__': ('task.html#arctask.__str__', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcTask._load_data': ('task.html#arctask._load_data', 'arcsolver/task.py'),
+                                'arcsolver.task.ArcTask.from_examples': ('task.html#arctask.from_examples', 'arcsolver/task.py'),
                                 'arcsolver.task.ArcTask.plot': ('task.html#arctask.plot', 'arcsolver/task.py'),
-                                'arcsolver.task.get_task_files': ('task.html#get_task_files', 'arcsolver/task.py')},
-            'arcsolver.utils': { 'arcsolver.utils.MultipleTagsError': ('utils.html#multipletagserror', 'arcsolver/utils.py'),
+                                'arcsolver.task.PackedCorpus': ('task.html#packedcorpus', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.__contains__': ('task.html#packedcorpus.__contains__', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.__getitem__': ('task.html#packedcorpus.__getitem__', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.__init__': ('task.html#packedcorpus.__init__', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.__iter__': ('task.html#packedcorpus.__iter__', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.__len__': ('task.html#packedcorpus.__len__', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.__repr__': ('task.html#packedcorpus.__repr__', 'arcsolver/task.py'),
+                                'arcsolver.task.PackedCorpus.task_ids': ('task.html#packedcorpus.task_ids', 'arcsolver/task.py'),
+                                'arcsolver.task.RenderCache': ('task.html#rendercache', 'arcsolver/task.py'),
+                                'arcsolver.task.RenderCache.__init__': ('task.html#rendercache.__init__', 'arcsolver/task.py'),
+                                'arcsolver.task.RenderCache.b64': ('task.html#rendercache.b64', 'arcsolver/task.py'),
+                                'arcsolver.task.RenderCache.clear': ('task.html#rendercache.clear', 'arcsolver/task.py'),
+                                'arcsolver.task.RenderCache.png': ('task.html#rendercache.png', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry': ('task.html#taskregistry', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry.__init__': ('task.html#taskregistry.__init__', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry.__len__': ('task.html#taskregistry.__len__', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry.__repr__': ('task.html#taskregistry.__repr__', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry.clear': ('task.html#taskregistry.clear', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry.get': ('task.html#taskregistry.get', 'arcsolver/task.py'),
+                                'arcsolver.task.TaskRegistry.task_ids': ('task.html#taskregistry.task_ids', 'arcsolver/task.py'),
+                                'arcsolver.task._TaskIds': ('task.html#_taskids', 'arcsolver/task.py'),
+                                'arcsolver.task._TaskIds.__getitem__': ('task.html#_taskids.__getitem__', 'arcsolver/task.py'),
+                                'arcsolver.task._TaskIds.__init__': ('task.html#_taskids.__init__', 'arcsolver/task.py'),
+                                'arcsolver.task._TaskIds.__iter__': ('task.html#_taskids.__iter__', 'arcsolver/task.py'),
+                                'arcsolver.task._TaskIds.__len__': ('task.html#_taskids.__len__', 'arcsolver/task.py'),
+                                'arcsolver.task._TaskIds.__repr__': ('task.html#_taskids.__repr__', 'arcsolver/task.py'),
+                                'arcsolver.task._corpus_cache_path': ('task.html#_corpus_cache_path', 'arcsolver/task.py'),
+                                'arcsolver.task._encode_png': ('task.html#_encode_png', 'arcsolver/task.py'),
+                                'arcsolver.task._plt': ('task.html#_plt', 'arcsolver/task.py'),
+                                'arcsolver.task._render_png': ('task.html#_render_png', 'arcsolver/task.py'),
+                                'arcsolver.task._rgba': ('task.html#_rgba', 'arcsolver/task.py'),
+                                'arcsolver.task._text_mask': ('task.html#_text_mask', 'arcsolver/task.py'),
+                                'arcsolver.task.get_task_files': ('task.html#get_task_files', 'arcsolver/task.py'),
+                                'arcsolver.task.pack_corpus': ('task.html#pack_corpus', 'arcsolver/task.py'),
+                                'arcsolver.task.pack_grids': ('task.html#pack_grids', 'arcsolver/task.py'),
+                                'arcsolver.task.unpack_grids': ('task.html#unpack_grids', 'arcsolver/task.py')},
+            'arcsolver.utils': { 'arcsolver.utils.LRUCache': ('utils.html#lrucache', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.__contains__': ('utils.html#lrucache.__contains__', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.__init__': ('utils.html#lrucache.__init__', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.__len__': ('utils.html#lrucache.__len__', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.__repr__': ('utils.html#lrucache.__repr__', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache._evict': ('utils.html#lrucache._evict', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.clear': ('utils.html#lrucache.clear', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.get': ('utils.html#lrucache.get', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.get_or_create': ('utils.html#lrucache.get_or_create', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.LRUCache.put': ('utils.html#lrucache.put', 'arcsolver/utils.py'),
+                                 'arcsolver.utils.MultipleTagsError': ('utils.html#multipletagserror', 'arcsolver/utils.py'),
                                  'arcsolver.utils.NoContentError': ('utils.html#nocontenterror', 'arcsolver/utils.py'),
                                  'arcsolver.utils.TagNotFoundError': ('utils.html#tagnotfounderror', 'arcsolver/utils.py'),
                                  'arcsolver.utils.parse_from_xml': ('utils.html#parse_from_xml', 'arcsolver/utils.py')}}}
@@ -6,8 +6,8 @@
 __all__ = ['sp_direct', 'sp_indiv', 'sp_merge', 'Description', 'ShapeExtractor', 'DescriptionGenerator']
 
 # %% ../nbs/02_describe.ipynb 5
-from .task import ArcTask, ArcPair
-from .ocm import Color
+from .task import ArcTask, ArcPair, registry
+from .ocm import Color, ShapeExtractor as _OcmShapeExtractor
 from .utils import parse_from_xml
 from claudette import *
 from fastcore.utils import *
@@ -15,10 +15,10 @@ from fastcore.meta import *
 from anthropic import AsyncAnthropic, AsyncAnthropicBedrock, AsyncAnthropicVertex
 from anthropic.types import Usage
 import asyncio
+from contextlib import nullcontext
 import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict, Optional
-from scipy import ndimage
 
 # %% ../nbs/02_describe.ipynb 7
 from toolslm.funccall import get_schema
@@ -31,10 +31,12 @@ async def __call__(self:AsyncChat,
         maxtok=4096, # Maximum tokens
         stream=False, # Stream response?
         prefill='', # Optional prefill to pass to Claude as start of its response
+        slots:Optional[asyncio.Semaphore]=None, # Semaphore to hold while the request is in flight (e.g. to cap requests across tasks)
         **kw):
     await self._append_pr(pr)
     if self.tools: kw['tools'] = [get_schema(o) for o in self.tools]
-    res = await self.c(self.h, stream=stream, prefill=prefill, sp=self.sp, temp=temp, maxtok=maxtok, **kw)
+    async with slots or nullcontext():
+        res = await self.c(self.h, stream=stream, prefill=prefill, sp=self.sp, temp=temp, maxtok=maxtok, **kw)
     if stream: return self._stream(res)
     self.h += mk_toolres(self.c.result, ns=self.tools)  #, obj=self)
     return res
@@ -195,7 +197,7 @@ async def _describe_direct(
     "Generate a description of an ARC task from all examples at once"
     
     if sp is None: sp = sp_direct
-    if isinstance(task, str): task = ArcTask(task)
+    if isinstance(task, str): task = registry.get(task)
 
     # Set up chat and get description
     client = _create_client(client_type, client_kwargs)
@@ -339,24 +341,18 @@ class ShapeExtractor:
         include_diagonal: bool,  # Consider diagonally adjacent cells as connected?
     ) -> list:  # List of extracted shapes (boolean arrays) and their positions
         """Extract contiguous regions of a specified color from a grid."""
-        ORTH = np.array([[0,1,0], [1,1,1], [0,1,0]])
-        DIAG = np.ones((3,3))
-        
         try:
-            arr = self.grids[grid_idx].data.copy()
+            arr = self.grids[grid_idx].data
         except IndexError as e:
             raise IndexError(f"Invalid grid_index {grid_idx}. Must be between 0 and {len(self.grids)-1}") from e
-    
-        value = Color.colors.index(color)
-        mask = (arr == value)
-        structure = DIAG if include_diagonal else ORTH
-        labeled, _ = ndimage.label(mask, structure=structure)
-        slices = ndimage.find_objects(labeled)
-    
-        regions = [[np.sum(mask[s]), s, labeled[s] == i+1] for i, s in enumerate(slices)]
-        return [(r[2], (r[1][0].start, r[1][1].start)) for r in regions]
 
-# %% ../nbs/02_describe.ipynb 32
+        # Labellings are memoized, so repeated queries from different chats don't relabel the grid.
+        # Components come in `ndimage.label` order, i.e. by the row-major position of their first cell
+        components = _OcmShapeExtractor.label_components(arr, include_diagonal, value=Color.colors.index(color))
+        return [(components.mask(k), (int(components.bboxes[k, 0]), int(components.bboxes[k, 1])))
+                for k in range(len(components))]
+
+# %% ../nbs/02_describe.ipynb 33
 @patch
 @delegates(AsyncChat.__call__)
 async def toolloop(self:AsyncChat,
@@ -376,7 +372,7 @@ async def toolloop(self:AsyncChat,
     if trace_func: trace_func(self.h[n_msgs:])
     return r
 
-# %% ../nbs/02_describe.ipynb 37
+# %% ../nbs/02_describe.ipynb 38
 sp_merge = """\
 You are an expert puzzle analyst tasked with deciphering complex visual transformation puzzles. \
 Your goal is to infer the general rule that governs how an input grid is transformed into an output grid \
@@ -441,7 +437,7 @@ If multiple interpretations are possible, choose the simplest one that explains
 Remember to close xml tags.
 """
 
-# %% ../nbs/02_describe.ipynb 38
+# %% ../nbs/02_describe.ipynb 39
 async def _describe_indirect(
     task: ArcTask | str,                        # Either an ArcTask object or a task ID string
     model: str = 'claude-3-5-sonnet-20241022',  # Model identifier (defaults to Sonnet 3.5)
@@ -455,7 +451,7 @@ async def _describe_indirect(
 ) -> Description:                               # Container holding description and the list of chats used
     "Generate a description of an ARC task by analyzing examples independently and then combining insights."
 
-    if isinstance(task, str): task = ArcTask(task)
+    if isinstance(task, str): task = registry.get(task)
 
     # Use default prompts if none provided
     if sp is None: sp = sp_indiv
@@ -471,7 +467,7 @@ async def _describe_indirect(
     
     # Process examples concurrently
     pair_tasks = [
-        chat.toolloop(mk_msg([pair.plot(to_base64=True), _pair_prompt(pair, i)], cache=client_type=='anthropic'), temp=temp)
+        chat.toolloop(mk_msg([pair.plot(to_base64=True), _pair_prompt(pair, i)], cache=client_type=='anthropic'), temp=temp, **kwargs)
         for i, (chat, pair) in enumerate(zip(pair_chats, task.train))
     ]
     responses = await asyncio.gather(*pair_tasks)
@@ -482,7 +478,7 @@ async def _describe_indirect(
         f'<description id="{i+1}">\n{r.content[0].text}\n</description>'
         for i, r in enumerate(responses)
     )
-    merged = await merge_chat([descs], temp=temp)
+    merged = await merge_chat([descs], temp=temp, **kwargs)
     
     # Create description with all chats used
     all_chats = pair_chats + [merge_chat]
@@ -492,7 +488,7 @@ async def _describe_indirect(
         method='indirect'
     )
 
-# %% ../nbs/02_describe.ipynb 41
+# %% ../nbs/02_describe.ipynb 42
 class DescriptionGenerator:
     "Generates descriptions of ARC tasks using Claude."
     def __init__(self, 
@@ -517,7 +513,7 @@ class DescriptionGenerator:
         "Create a new chat instance."
         return _create_chat(self.model, self._create_client(), sp, tools)
 
-# %% ../nbs/02_describe.ipynb 44
+# %% ../nbs/02_describe.ipynb 45
 @patch
 async def describe_direct(
     self: DescriptionGenerator,
@@ -534,7 +530,7 @@ async def describe_direct(
     ]
     return await asyncio.gather(*tasks)
 
-# %% ../nbs/02_describe.ipynb 53
+# %% ../nbs/02_describe.ipynb 54
 @patch
 async def describe_indirect(
     self: DescriptionGenerator,
@@ -551,7 +547,7 @@ async def describe_indirect(
     ]
     return await asyncio.gather(*tasks)
 
-# %% ../nbs/02_describe.ipynb 64
+# %% ../nbs/02_describe.ipynb 65
 @patch
 async def describe_task(
     self: DescriptionGenerator,
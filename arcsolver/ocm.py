@@ -3,16 +3,20 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_ocm.ipynb.
 
 # %% auto 0
-__all__ = ['Vector', 'Color', 'Direction', 'Object', 'Rectangle', 'Line', 'Bitmap', 'Grid', 'ShapeExtractor', 'PatternMatcher',
-           'EnclosureFiller', 'CyclicPattern']
+__all__ = ['Vector', 'Color', 'Direction', 'Object', 'Rectangle', 'Line', 'Bitmap', 'Grid', 'Components', 'Region',
+           'ShapeExtractor', 'PatternMatcher', 'PatternMatch', 'PatternIndex', 'EnclosureFiller', 'CyclicPattern']
 
 # %% ../nbs/01_ocm.ipynb 5
 from fastcore.utils import *
 from enum import Enum
+import hashlib
 from typing import ClassVar, List, Optional, Tuple, Union, Literal
 import numpy as np
 from pydantic import BaseModel, Field, field_validator, model_validator
 from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from .utils import LRUCache
 
 # %% ../nbs/01_ocm.ipynb 8
 class Vector(BaseModel):
@@ -213,6 +217,104 @@ class Grid(BaseModel):
         return self
 
 # %% ../nbs/01_ocm.ipynb 73
+class Components(BaseModel):
+    "Connected components of all colors in an array, ordered by color, then by the row-major position of their first cell."
+    labels: np.ndarray  # Component index of each cell (-1 for cells that don't belong to a component)
+    colors: np.ndarray  # Color of each component
+    counts: np.ndarray  # Number of cells in each component
+    bboxes: np.ndarray  # Bounding box of each component as (top, left, bottom, right), with bottom/right exclusive
+    order: np.ndarray   # Component indices in region order (by color, then most cells of that color in the bounding box)
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def __len__(self) -> int: return len(self.colors)
+
+    def bbox_slice(self, k: int) -> Tuple[slice, slice]:
+        "Slices selecting the bounding box of component `k`."
+        top, left, bottom, right = self.bboxes[k]
+        return slice(int(top), int(bottom)), slice(int(left), int(right))
+
+    def mask(self, k: int) -> np.ndarray:
+        "Boolean mask of the cells of component `k` within its bounding box."
+        return self.labels[self.bbox_slice(k)] == k
+
+
+class Region:
+    """
+    A single connected component, held as zero-copy views into a shared label image and the source array.
+    Exact masks, data and `Bitmap`s are only materialized when requested.
+    """
+    __slots__ = ('components', 'index', 'array', 'top', 'left', 'bottom', 'right')
+
+    def __init__(self,
+                 components: Components,  # Labelling the region belongs to
+                 index: int,  # Index of the region's component
+                 array: np.ndarray,  # Array that was labelled
+                 bbox: Optional[Tuple[int, int, int, int]] = None  # The component's bounding box, if already known
+                ):
+        self.components, self.index, self.array = components, index, array
+        self.top, self.left, self.bottom, self.right = bbox or components.bboxes[index].tolist()
+
+    @property
+    def labels(self) -> np.ndarray: return self.components.labels[self.top:self.bottom, self.left:self.right]
+    @property
+    def values(self) -> np.ndarray: return self.array[self.top:self.bottom, self.left:self.right]
+    @property
+    def position(self) -> Vector: return Vector(self.top, self.left)
+    @property
+    def color(self) -> int: return int(self.components.colors[self.index])
+    @property
+    def size(self) -> int: return int(self.components.counts[self.index])
+    @property
+    def mask(self) -> np.ndarray: return self.labels == self.index
+
+    @property
+    def data(self) -> np.ndarray:
+        "The region's values, with -1 for cells in its bounding box that belong to other regions."
+        return np.where(self.mask, self.values, -1).astype(int, copy=False)
+
+    def to_bitmap(self) -> Bitmap: return Bitmap(position=self.position, data=self.data)
+
+    def __repr__(self): return f"Region(color={self.color}, size={self.size}, position=({self.top}, {self.left}), shape={self.labels.shape})"
+
+# %% ../nbs/01_ocm.ipynb 74
+class ComponentCache(LRUCache):
+    "Bounded LRU of `Components`, keyed by grid fingerprint, labelled value, connectivity and background color"
+    def __init__(self,
+                 maxsize: int = 1024  # Maximum number of labellings to keep
+                ):
+        super().__init__(maxsize)
+
+    @staticmethod
+    def fingerprint(array: np.ndarray) -> bytes:
+        "Digest of an array's dtype, shape and contents"
+        h = hashlib.blake2b(f"{array.dtype.str}{array.shape}".encode(), digest_size=16)
+        h.update(np.ascontiguousarray(array).data)
+        return h.digest()
+
+    @staticmethod
+    def _label(array, include_diagonal, background_color, value) -> Components:
+        "Label `array`, freezing the result since cached labellings are shared"
+        components = ShapeExtractor._label_components(array, include_diagonal, background_color, value)
+        for a in (components.labels, components.colors, components.counts, components.bboxes, components.order): a.setflags(write=False)
+        return components
+
+    def components(self,
+                   array: np.ndarray,
+                   include_diagonal: bool = False,
+                   background_color: Optional[int] = None,
+                   value: Optional[int] = None
+                  ) -> Components:
+        "`ShapeExtractor` labelling of `array`, computed only on a miss"
+        array = np.asarray(array)
+        if value is not None: value, background_color = int(value), None  # The background doesn't affect single-value labelling
+        elif background_color is not None: background_color = int(background_color)
+        key = (self.fingerprint(array), value, bool(include_diagonal), background_color)
+        return self.get_or_create(key, lambda: self._label(array, include_diagonal, background_color, value))
+
+component_cache = ComponentCache()
+
+# %% ../nbs/01_ocm.ipynb 75
 class ShapeExtractor:
     'Extract distinct "shapes" (i.e. contiguous regions of the same value) from a numpy array'
     # Define the connectivity structures as class attributes
@@ -220,25 +322,93 @@ class ShapeExtractor:
     DIAG = np.ones((3,3))
 
     @staticmethod
-    def extract_contiguous_regions(
+    def label_components(
+        array: np.ndarray,  # Numpy array
+        include_diagonal: bool = False,  # Consider diagonally adjacent cells as connected or not
+        background_color: Optional[int] = None,  # Optionally specify a background color to ignore
+        value: Optional[int] = None  # Only label cells of this value (None labels every value)
+    ) -> Components:
+        "Label the connected components of every color in a single pass over the array (memoized per grid)."
+        return component_cache.components(array, include_diagonal, background_color, value)
+
+    @staticmethod
+    def _label_components(
         array: np.ndarray,
-        value: int,
         include_diagonal: bool = False,
-        background_color: Optional[int] = None
-    ) -> List[Tuple[np.ndarray, Tuple[int, int]]]:
-        """Extract contiguous regions of a specified value from a numpy array. Can include diagonal connections if specified."""
-        arr = array.copy()
-        mask = (arr == value)
-        structure = ShapeExtractor.DIAG if include_diagonal else ShapeExtractor.ORTH
-        labeled, _ = ndimage.label(mask, structure=structure)
-        slices = ndimage.find_objects(labeled)
+        background_color: Optional[int] = None,
+        value: Optional[int] = None
+    ) -> Components:
+        h, w = array.shape
+        if value is not None:
+            # A single value's components are exactly `ndimage.label`'s, already numbered in row-major order of their first cell
+            labels, n = ndimage.label(array == value, structure=ShapeExtractor.DIAG if include_diagonal else ShapeExtractor.ORTH)
+            bboxes = np.array([(r.start, c.start, r.stop, c.stop) for r, c in ndimage.find_objects(labels)], dtype=int).reshape(n, 4)
+            colors = np.full(n, value, dtype=array.dtype)
+            return Components(labels=labels - 1, colors=colors, counts=np.bincount(labels.ravel(), minlength=n + 1)[1:],
+                              bboxes=bboxes, order=ShapeExtractor._region_order(array, colors, bboxes))
+        if background_color is not None: valid = array != background_color
+        else: valid = np.ones(array.shape, dtype=bool)
+
+        # Link each cell to the neighbours (right, down, and optionally diagonals) that have the same value
+        cells = np.arange(h * w).reshape(h, w)
+        neighbours = [(np.s_[:, :-1], np.s_[:, 1:]), (np.s_[:-1, :], np.s_[1:, :])]
+        if include_diagonal: neighbours += [(np.s_[:-1, :-1], np.s_[1:, 1:]), (np.s_[:-1, 1:], np.s_[1:, :-1])]
+        links = [(array[a] == array[b]) & valid[a] for a, b in neighbours]
+        src = np.concatenate([cells[a][m] for (a, _), m in zip(neighbours, links)])
+        dst = np.concatenate([cells[b][m] for (_, b), m in zip(neighbours, links)])
+        graph = coo_matrix((np.ones(len(src), dtype=bool), (src, dst)), shape=(h * w, h * w))
+        _, labels = connected_components(graph, directed=False)
+
+        # Group the cells of each component (stable, so each group starts with its first cell in row-major order)
+        flat = np.flatnonzero(valid)
+        order = flat[np.argsort(labels[flat], kind='stable')]
+        if not len(order): return Components(labels=np.full(array.shape, -1), colors=np.zeros(0, dtype=array.dtype),
+                                              counts=np.zeros(0, dtype=int), bboxes=np.zeros((0, 4), dtype=int),
+                                              order=np.zeros(0, dtype=int))
+        starts = np.flatnonzero(np.r_[True, labels[order][1:] != labels[order][:-1]])
+        counts = np.diff(np.r_[starts, len(order)])
+        rows, cols = np.divmod(order, w)
+        bboxes = np.stack([np.minimum.reduceat(rows, starts), np.minimum.reduceat(cols, starts),
+                           np.maximum.reduceat(rows, starts) + 1, np.maximum.reduceat(cols, starts) + 1], axis=1)
+        first = order[starts]
+        colors = array.ravel()[first]
+
+        # Order components by color, then position of their first cell (the order `ndimage.label` gives per color)
+        rank = np.lexsort((first, colors))
+        index = np.full(h * w, -1)
+        index[labels[first[rank]]] = np.arange(len(rank))
+        colors, bboxes = colors[rank], bboxes[rank]
+        return Components(labels=np.where(valid, index[labels].reshape(h, w), -1), colors=colors, counts=counts[rank],
+                          bboxes=bboxes, order=ShapeExtractor._region_order(array, colors, bboxes))
 
-        regions = sorted([(np.sum(mask[s]), s, arr[s]) for s in slices],
-                         key=lambda x: x[0], reverse=True)
-        for region in regions:
-            if background_color is not None: region[2][region[2] == background_color] = -1
+    @staticmethod
+    def _region_order(array: np.ndarray, colors: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+        "Component indices ordered by color, then by the number of cells of that color in their bounding box (largest first)."
+        top, left, bottom, right = bboxes.T
+        in_box, integral = np.zeros(len(colors), dtype=int), np.zeros((array.shape[0] + 1, array.shape[1] + 1), dtype=int)
+        for c in np.unique(colors):
+            # Integral image of the cells of color `c`, so the count in any box takes four lookups
+            integral[1:, 1:] = (array == c).cumsum(0).cumsum(1)
+            k = colors == c
+            in_box[k] = integral[bottom[k], right[k]] - integral[top[k], right[k]] - integral[bottom[k], left[k]] + integral[top[k], left[k]]
+        return np.lexsort((-in_box, colors))  # Stable, so ties keep their row-major order
 
-        return [(r[2], (r[1][0].start, r[1][1].start)) for r in regions]
+    @staticmethod
+    def extract_contiguous_regions(
+        array: np.ndarray,
+        value: int,
+        include_diagonal: bool = False,
+        background_color: Optional[int] = None,
+        masks: bool = False  # Return exact `Region`s (views into one label image) instead of bounding-box sub-arrays
+    ) -> List[Tuple[Union[np.ndarray, Region], Tuple[int, int]]]:
+        """
+        Extract contiguous regions of a specified value from a numpy array. Can include diagonal connections if specified.
+        Regions are sorted by the number of cells of `value` inside their bounding box (largest first)."""
+        components = ShapeExtractor.label_components(array, include_diagonal, value=value)
+        order, bboxes = components.order, components.bboxes.tolist()
+        if masks: return [(Region(components, k, array, bboxes[k]), tuple(bboxes[k][:2])) for k in order]
+        arr = array.astype(int) if background_color is None else np.where(array == background_color, -1, array.astype(int, copy=False))
+        return [(arr[top:bottom, left:right], (top, left)) for top, left, bottom, right in map(bboxes.__getitem__, order)]
 
     @staticmethod
     def extract_largest_shape(
@@ -256,23 +426,62 @@ class ShapeExtractor:
     def extract_all_shapes(
         array: np.ndarray,  # Numpy array
         include_diagonal: bool = False,  # Consider diagonally adjacent cells as connected or not
-        background_color: Optional[int] = None  # Optionally specify a background color to ignore
-    ) -> List[Tuple[np.ndarray, Tuple[int, int], int]]:  # List of (sub-array, position, color_value) tuples
-        "Extract all shapes of all values from a numpy array."
-        all_shapes = []
-        for value in np.unique(array):
-            if background_color is not None and value == background_color: continue
-            shapes = ShapeExtractor.extract_contiguous_regions(array, value, include_diagonal, background_color)
-            all_shapes.extend([(shape, pos, value) for shape, pos in shapes])
-        return all_shapes
-
-# %% ../nbs/01_ocm.ipynb 76
+        background_color: Optional[int] = None,  # Optionally specify a background color to ignore
+        masks: bool = False  # Return exact `Region`s (views into one label image) instead of bounding-box sub-arrays
+    ) -> List[Tuple[Union[np.ndarray, Region], Tuple[int, int], int]]:  # List of (sub-array or region, position, color_value) tuples
+        "Extract all shapes of all values from a numpy array, ordered by value and then as in `extract_contiguous_regions`."
+        components = ShapeExtractor.label_components(array, include_diagonal, background_color)
+        order, bboxes = components.order, components.bboxes.tolist()
+        if masks: return [(Region(components, k, array, bboxes[k]), tuple(bboxes[k][:2]), components.colors[k]) for k in order]
+        arr = array.astype(int) if background_color is None else np.where(array == background_color, -1, array.astype(int, copy=False))
+        return [(arr[top:bottom, left:right], (top, left), components.colors[k])
+                for k, (top, left, bottom, right) in zip(order, map(bboxes.__getitem__, order))]
+
+# %% ../nbs/01_ocm.ipynb 85
 class PatternMatcher:
     """
     A class for finding alignments between patterns in numpy arrays.
     Supports exact matching and partial matching with missing or extra elements.
     """
 
+    @staticmethod
+    def _match_counts(
+        target: np.ndarray,  # The larger array to search in
+        patterns: np.ndarray,  # Stack of same-shape patterns, shape (k, h, w)
+        match_type: str = 'exact'  # 'exact', 'allow_missing', or 'allow_extra'
+    ) -> np.ndarray:  # (k, H-h+1, W-w+1) overlap counts, -1 where a pattern doesn't match
+        """Check every pattern at every offset at once, one pattern cell at a time over shifted views of the target."""
+        k, h, w = patterns.shape
+        H, W = target.shape[0] - h + 1, target.shape[1] - w + 1
+        ok = np.ones((k, H, W), dtype=bool)
+        overlap = np.zeros((k, H, W), dtype=int)
+        for di in range(h):
+            for dj in range(w):
+                window = target[di:di+H, dj:dj+W][None]
+                pattern = patterns[:, di, dj][:, None, None]
+                window_nonzero, pattern_nonzero = window != 0, pattern != 0
+                both_nonzero = window_nonzero & pattern_nonzero
+
+                # Overlapping non-zero elements must match, plus the checks for match_type
+                ok &= ~(both_nonzero & (window != pattern))
+                if match_type != 'allow_missing': ok &= ~(window_nonzero & ~pattern_nonzero)
+                if match_type != 'allow_extra': ok &= ~(pattern_nonzero & ~window_nonzero)
+                overlap += both_nonzero
+
+        # Only include non-zero overlaps
+        return np.where(ok & (overlap > 0), overlap, -1)
+
+    @staticmethod
+    def _to_matches(counts: np.ndarray, match_type: str) -> List[Tuple[Vector, int]]:
+        """Convert an array of overlap counts to a list of (position, overlap_count) matches."""
+        i, j = np.nonzero(counts >= 0)  # Row-major, i.e. the order offsets are scanned in
+        overlap = counts[i, j]
+        # Sort matches by overlap count if not exact matching (stable, so ties keep scan order)
+        if match_type != 'exact':
+            order = np.argsort(-overlap, kind='stable')
+            i, j, overlap = i[order], j[order], overlap[order]
+        return [(Vector(i=int(a), j=int(b)), int(c)) for a, b, c in zip(i, j, overlap)]
+
     @staticmethod
     def find_matches(
         target: np.ndarray,  # The larger array to search in
@@ -283,37 +492,25 @@ class PatternMatcher:
         Find positions where a pattern aligns with a target, sorted by overlap count
         for non-exact matches.
         """
-        h, w = pattern.shape
-        H, W = target.shape
-        matches = []
-
-        for i in range(H - h + 1):
-            for j in range(W - w + 1):
-                window = target[i:i+h, j:j+w]
-
-                # Get masks for non-zero elements
-                pattern_nonzero = pattern != 0
-                window_nonzero = window != 0
-
-                # Check for mismatches based on match_type
-                if match_type != 'allow_missing':
-                    if np.any(window_nonzero & ~pattern_nonzero): continue
-
-                if match_type != 'allow_extra':
-                    if np.any(pattern_nonzero & ~window_nonzero): continue
-
-                # Check that overlapping non-zero elements match
-                both_nonzero = window_nonzero & pattern_nonzero
-                if not np.array_equal(window[both_nonzero], pattern[both_nonzero]): continue
-
-                # Count overlapping non-zero elements and only include non-zero overlaps
-                overlap_count = np.sum(both_nonzero)
-                if overlap_count > 0:
-                    matches.append((Vector(i=i, j=j), int(overlap_count)))
+        if pattern.shape[0] > target.shape[0] or pattern.shape[1] > target.shape[1]: return []
+        counts = PatternMatcher._match_counts(target, pattern[None], match_type)[0]
+        return PatternMatcher._to_matches(counts, match_type)
 
-        # Sort matches by overlap count if not exact matching
-        if match_type == 'exact': return matches
-        return sorted(matches, key=lambda x: x[1], reverse=True)
+    @staticmethod
+    def find_matches_batch(
+        target: np.ndarray,  # The larger array to search in
+        patterns: List[np.ndarray],  # Patterns to match (they can have different shapes)
+        match_type: str = 'exact'  # 'exact', 'allow_missing', or 'allow_extra'
+    ) -> List[List[Tuple[Vector, int]]]:  # `find_matches(target, pattern, match_type)` for each pattern
+        """Find the matches of many patterns in one target, checking same-shape patterns together."""
+        results = [[] for _ in patterns]
+        by_shape = {}
+        for k, pattern in enumerate(patterns): by_shape.setdefault(pattern.shape, []).append(k)
+        for (h, w), ks in by_shape.items():
+            if h > target.shape[0] or w > target.shape[1]: continue
+            counts = PatternMatcher._match_counts(target, np.stack([patterns[k] for k in ks]), match_type)
+            for k, c in zip(ks, counts): results[k] = PatternMatcher._to_matches(c, match_type)
+        return results
 
     @staticmethod
     def find_best_match(
@@ -336,7 +533,72 @@ class PatternMatcher:
         i, j = position.i, position.j
         return target[i:i+h, j:j+w].copy()
 
-# %% ../nbs/01_ocm.ipynb 79
+# %% ../nbs/01_ocm.ipynb 91
+class PatternMatch(BaseModel):
+    "A match of one rotated/flipped pattern from a `PatternIndex` in a target array."
+    pattern: int  # Index of the pattern in the list the index was built from
+    rotation: int  # Number of 90 degree rotations applied (as in `Bitmap.rotate(rotation)`)
+    flipped: bool  # Whether the rotated pattern was then flipped left-right (as in `Bitmap.flip(1)`)
+    position: Vector  # Top-left position of the match in the target
+    overlap: int  # Number of overlapping non-zero cells
+
+
+class PatternIndex:
+    """
+    Rotation/flip-aware index over a set of patterns. The dihedral variants of each pattern are
+    computed once, and all variants are matched against a target together.
+    """
+    transforms: ClassVar[List[Tuple[int, bool]]] = [(n, flipped) for flipped in (False, True) for n in range(4)]
+
+    def __init__(self,
+                 patterns: List[Union[np.ndarray, Bitmap]],  # Patterns (arrays or `Bitmap`s) to index
+                 transforms: Optional[List[Tuple[int, bool]]] = None  # (rotation, flipped) variants to include (default all 8)
+                ):
+        self.patterns = [p.data if isinstance(p, Bitmap) else np.asarray(p) for p in patterns]
+        self._groups = PatternIndex._variant_groups(self.patterns, transforms or self.transforms)
+
+    @staticmethod
+    def _variant_groups(patterns: List[np.ndarray], transforms: List[Tuple[int, bool]]) -> dict:
+        "Distinct variants of each pattern, stacked by shape: shape -> (variants, [(pattern, rotation, flipped, transform order)])"
+        groups = {}
+        for k, pattern in enumerate(patterns):
+            seen = []
+            for t, (n, flipped) in enumerate(transforms):
+                variant = PatternIndex.transform(pattern, n, flipped)
+                # Symmetric patterns have repeated variants; only the first transform is reported
+                if any(v.shape == variant.shape and np.array_equal(v, variant) for v in seen): continue
+                seen.append(variant)
+                arrays, keys = groups.setdefault(variant.shape, ([], []))
+                arrays.append(variant)
+                keys.append((k, n, flipped, t))
+        return {shape: (np.stack(arrays), keys) for shape, (arrays, keys) in groups.items()}
+
+    @staticmethod
+    def transform(pattern: np.ndarray, rotation: int = 0, flipped: bool = False) -> np.ndarray:
+        """Rotate a pattern by `rotation` quarter turns, then optionally flip it left-right."""
+        pattern = np.rot90(pattern, k=rotation)
+        return np.flip(pattern, axis=1) if flipped else pattern
+
+    def find_matches(
+        self,
+        target: np.ndarray,  # The larger array to search in
+        match_type: str = 'exact'  # 'exact', 'allow_missing', or 'allow_extra'
+    ) -> List[PatternMatch]:
+        """
+        Find every position where any variant of any pattern matches the target. Matches are ordered
+        by pattern, transform and position, then by overlap count for non-exact matches.
+        """
+        found = []
+        for (h, w), (variants, keys) in self._groups.items():
+            if h > target.shape[0] or w > target.shape[1]: continue
+            counts = PatternMatcher._match_counts(target, variants, match_type)
+            for c, i, j in zip(*np.nonzero(counts >= 0)): found.append((keys[c], int(i), int(j), int(counts[c, i, j])))
+        found.sort(key=lambda f: (f[0][0], f[0][3], f[1], f[2]))
+        if match_type != 'exact': found.sort(key=lambda f: -f[3])
+        return [PatternMatch(pattern=k, rotation=n, flipped=flipped, position=Vector(i=i, j=j), overlap=overlap)
+                for (k, n, flipped, _), i, j, overlap in found]
+
+# %% ../nbs/01_ocm.ipynb 93
 class EnclosureFiller:
     'Fill areas of an array that are "enclosed" by cells of a given value'
     @staticmethod
@@ -356,7 +618,7 @@ class EnclosureFiller:
         output_mask = np.isin(labeled_array, border_labels, invert=True)
         return output_mask.astype(int)
 
-# %% ../nbs/01_ocm.ipynb 80
+# %% ../nbs/01_ocm.ipynb 94
 class CyclicPattern(BaseModel):
     """
     Identify, represent, and manipulate cyclic patterns in ARC task grids,
@@ -3,13 +3,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_solve.ipynb.
 
 # %% auto 0
-__all__ = ['ocm', 'sp_solve', 'Solution', 'CodeValidator', 'Attempt', 'ExecutionResult', 'SandboxedExecutor',
-           'ConcurrentExecutor', 'run_solutions', 'feedback', 'SolutionTree', 'ArcSolver']
+__all__ = ['ocm', 'sp_solve', 'Solution', 'CodeValidator', 'Attempt', 'ExecutionResult', 'ExecutionLimits', 'SandboxJob',
+           'SharedGrids', 'SandboxedExecutor', 'SandboxWorker', 'WarmWorkerPool', 'ForkServer', 'ExecutionCache',
+           'ConcurrentExecutor', 'run_solutions', 'run_solutions_async', 'feedback', 'SolutionTree', 'ArcSolver']
 
 # %% ../nbs/03_solve.ipynb 4
-from .task import ArcTask, train_tasks, ArcGrid, ArcPair
+from .task import ArcTask, ArcGrid, ArcPair, pack_grids, unpack_grids, registry, render_cache
 from .describe import Description, DescriptionGenerator, _create_chat, _create_client
-from .utils import parse_from_xml, TagNotFoundError, NoContentError, MultipleTagsError
+from .utils import parse_from_xml, TagNotFoundError, NoContentError, MultipleTagsError, LRUCache
 from .score import score as _score
 from .examples import examples
 from claudette import *
@@ -18,11 +19,24 @@ from fastcore.meta import *
 from anthropic import AsyncAnthropicBedrock
 import asyncio
 import numpy as np
-from dataclasses import dataclass, field
-from typing import List, Optional, Set, Dict, Callable
+from dataclasses import dataclass, field, asdict, replace
+from typing import List, Optional, Set, Dict, Callable, AsyncIterator
 import ast
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 import subprocess
+import select
+import struct
+import queue
+import atexit
+import threading
+import weakref
+from multiprocessing import shared_memory
+import itertools
+import hashlib
+from collections import defaultdict
+import time
+import os
+import signal
 import tempfile
 from pathlib import Path
 import pickle
@@ -283,6 +297,30 @@ class ExecutionResult:
 
 # %% ../nbs/03_solve.ipynb 25
 @dataclass
+class HistoryIndex:
+    "Side index of a chat history, updated incrementally so preparing a retry doesn't rescan the whole history"
+    n: int = 0                                          # Number of history messages indexed so far
+    images: set = field(default_factory=set)            # base64 payloads of images sent in user messages
+    breakpoints: list = field(default_factory=list)     # (message, content part) positions of cache_control breakpoints, oldest first
+
+    def update(self, hist: list) -> 'HistoryIndex':
+        "Index any messages appended to `hist` since the last update"
+        for i in range(self.n, len(hist)):
+            m = hist[i]
+            if not isinstance(m, dict) or not isinstance(m.get('content'), list): continue
+            for j, d in enumerate(m['content']):
+                if not isinstance(d, dict): continue
+                if m['role'] == 'user' and 'source' in d: self.images.add(d['source']['data'])
+                if 'cache_control' in d: self.breakpoints.append((i, j))
+        self.n = len(hist)
+        return self
+
+    def copy(self) -> 'HistoryIndex':
+        "Copy for a branched history (the index is small, so this is cheap)"
+        return HistoryIndex(self.n, set(self.images), list(self.breakpoints))
+
+# %% ../nbs/03_solve.ipynb 26
+@dataclass
 class Attempt:
     "An attempt at solving an ARC task."
     task: ArcTask                                            # The ARC task being solved
@@ -294,8 +332,10 @@ class Attempt:
     children: List['Attempt'] = field(default_factory=list)  # Any retries from this attempt
     result: Optional[ExecutionResult] = None                 # Result of executing the solution code
     error: Optional[str] = None                              # Error trying to generate solution code
+    cancelled: bool = False                                  # Execution was cancelled because another attempt solved the task
+    history: HistoryIndex = field(default_factory=HistoryIndex)  # Index of the images and cache breakpoints in `chat.h`
 
-# %% ../nbs/03_solve.ipynb 28
+# %% ../nbs/03_solve.ipynb 29
 async def attempt_solution(
     root: Attempt,                              # `Attempt` object containing the task and description to generate solutions for
     model: str = 'claude-3-5-sonnet-20241022',  # Model identifier (defaults to Sonnet 3.5)
@@ -330,7 +370,7 @@ async def attempt_solution(
         root.children.append(a)
         return a
 
-# %% ../nbs/03_solve.ipynb 32
+# %% ../nbs/03_solve.ipynb 33
 @dataclass
 class ExecutionResult:
     "Contains all results from a solution attempt execution"
@@ -338,8 +378,77 @@ class ExecutionResult:
     out_preds: Optional[List[ArcGrid]] = None    # from OutputModel.from_input(...).to_array()
     error: Optional[str] = None                  # Overall code execution error
     example_errors: Optional[List[str]] = None   # Per-example errors
+    test: Optional['ExecutionResult'] = None     # Results on the test inputs (train jobs only, once every train output is correct)
+    limit: Optional[str] = None                  # Resource limit that cut execution short: 'timeout', 'example_timeout', 'cpu', 'memory' or 'output'
+    exec_time: Optional[float] = None            # Seconds spent exec'ing the solution code
+    example_timings: Optional[List[Dict[str, float]]] = None  # Per-example seconds spent in 'from_array', 'input_to_array', 'from_input' and 'output_to_array'
+    peak_rss_mb: Optional[float] = None          # Peak resident set size of the sandbox process during the job in MB
+    cached: bool = False                         # Reused from an `ExecutionCache`, so the timings and peak RSS are from an earlier run
+
+    @property
+    def run_time(self) -> Optional[float]:
+        "Total seconds spent running the solution code (exec plus every example phase)"
+        if self.exec_time is None: return None
+        return self.exec_time + sum(s for t in self.example_timings or [] for s in t.values())
+
+
+@dataclass
+class ExecutionLimits:
+    "Resource limits applied to every sandboxed execution of a solution"
+    timeout: float = 5                        # Wall-clock seconds for the whole job
+    example_timeout: Optional[float] = None   # Wall-clock seconds for each example's `from_array` ... `to_array` steps
+    cpu_seconds: Optional[int] = 10           # CPU seconds for the whole job (`RLIMIT_CPU`)
+    memory_mb: Optional[int] = 4096           # Address space of the sandbox process in MB (`RLIMIT_AS`)
+    max_output_mb: Optional[float] = 64       # Max size of the pickled result in MB
 
 # %% ../nbs/03_solve.ipynb 34
+class SandboxJob:
+    "Handle on a submitted sandbox job that lets another thread kill it, whether or not it has started yet"
+    def __init__(self):
+        self.cancelled, self._kill, self._lock = False, None, threading.Lock()
+
+    def attach(self, kill: Optional[Callable] = None):
+        "Register how to kill the running job (`None` once it has finished); kills straight away if it was already cancelled"
+        with self._lock:
+            self._kill = kill
+            if kill is not None and self.cancelled: kill()
+
+    def cancel(self):
+        "Mark the job cancelled and kill it if it is running"
+        with self._lock:
+            self.cancelled = True
+            if self._kill is not None: self._kill()
+
+# %% ../nbs/03_solve.ipynb 36
+class SharedGrids:
+    "All grids of an ARC task packed into one shared-memory block that sandbox processes map by name"
+    _lock = threading.Lock()
+
+    def __init__(self, task: ArcTask):
+        # Grid 2i is the input and 2i+1 the output of example i, with the test examples after the train ones
+        packed = pack_grids([g for ex in task.train + task.test for g in (ex.input, ex.output)])
+        self.shm = shared_memory.SharedMemory(create=True, size=len(packed))
+        self.shm.buf[:len(packed)] = packed
+        self.name = self.shm.name
+        self._finalizer = weakref.finalize(self, SharedGrids._release, self.shm)
+
+    @staticmethod
+    def _release(shm: shared_memory.SharedMemory):
+        shm.close()
+        shm.unlink()
+
+    def close(self):
+        "Free the shared-memory block"
+        self._finalizer()
+
+    @classmethod
+    def for_task(cls, task: ArcTask) -> 'SharedGrids':
+        "The task's block, created on first use and freed when the task is garbage collected"
+        with cls._lock:
+            if '_shared_grids' not in task.__dict__: task._shared_grids = cls(task)
+            return task._shared_grids
+
+# %% ../nbs/03_solve.ipynb 38
 class SandboxedExecutor:
     "Executes ARC solutions in a separate Python process with detailed results"
 
@@ -354,9 +463,17 @@ from collections import defaultdict
 """
     
     RUNNER_SCRIPT = """
+import os
 import sys
+import math
+import time
 import pickle
-from arcsolver.task import ArcGrid
+import select
+import signal
+import struct
+import resource
+from multiprocessing import shared_memory, resource_tracker
+from arcsolver.task import ArcGrid, pack_grids, unpack_grids
 import traceback
 import numpy as np
 
@@ -374,7 +491,7 @@ def _format_error():
         filename = frame.f_code.co_filename
         function = frame.f_code.co_name
         
-        if filename == '<string>':  # This is our solution code
+        if filename == '<solution>':  # This is our solution code
             lineno = frame.f_lineno
             source = linecache.getline('<solution>', lineno).strip()
             lines.append(f'  File "<solution>", line {{lineno}}, in {{function}}\\n    {{source}}')
@@ -383,73 +500,339 @@ def _format_error():
     lines.append(f"{{exc_type.__name__}}: {{str(exc_value)}}")
     return '\\n'.join(lines)
 
-def run_solution():
-    # Load input data efficiently from stdin
-    input_data = pickle.load(sys.stdin.buffer)
-    code = IMPORTS + input_data['code']
-    examples = input_data['examples']  # List of (input_grid, output_grid) tuples
-    
+class ExampleTimeout(Exception): pass
+
+def _raise_example_timeout(signum, frame):
+    raise ExampleTimeout("Example exceeded its wall-clock time budget")
+
+def _limit_hit(e):
+    # Which resource limit (if any) an exception was caused by
+    return 'memory' if isinstance(e, MemoryError) else 'example_timeout' if isinstance(e, ExampleTimeout) else None
+
+def apply_limits(limits):
+    # Only soft limits are set, so a warm worker can relax them again for its next job
+    def set_soft(res, soft):
+        hard = resource.getrlimit(res)[1]
+        if soft is None or (hard != resource.RLIM_INFINITY and soft > hard): soft = hard
+        try: resource.setrlimit(res, (soft, hard))
+        except (ValueError, OSError): pass  # e.g. RLIMIT_AS is not enforced on macOS
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu, mem = limits.get('cpu_seconds'), limits.get('memory_mb')
+    # RLIMIT_CPU counts from process start, so allow `cpu_seconds` on top of what has been used already
+    set_soft(resource.RLIMIT_CPU, math.ceil(usage.ru_utime + usage.ru_stime) + cpu if cpu else None)
+    set_soft(resource.RLIMIT_AS, mem << 20 if mem else None)
+
+def timed(timings, phase, fn, *args):
+    # Call `fn`, recording how long it took (even if it raised) under `phase`
+    start = time.perf_counter()
+    try: return fn(*args)
+    finally: timings[phase] = time.perf_counter() - start
+
+_jobs_run = 0  # Jobs this process has executed (warm workers run many)
+
+def reset_peak_rss():
+    # Reset the peak RSS (VmHWM) to the current RSS on Linux, so the next reading only covers this job
     try:
-        # Set up line cache for better tracebacks
-        linecache.cache['<solution>'] = (
-            len(code),
-            None,
-            code.splitlines(keepends=True),
-            '<solution>'
-        )
+        with open('/proc/self/clear_refs', 'w') as f: f.write('5')
+        return True
+    except OSError: return False
 
-        # Execute the solution code
-        namespace = {{}}
-        exec(code, namespace)
-        InputModel, OutputModel = namespace['InputModel'], namespace['OutputModel']
-        reconstructed_inputs, predicted_outputs = [], []
-        example_errors = []
-        
-        for i, (input_arr, expected_arr) in enumerate(examples):
+def peak_rss_mb(reset):
+    if reset:
+        try:
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'): return int(line.split()[1]) / (1 << 10)
+        except OSError: pass
+    # ru_maxrss is the peak over the whole process, so it's only this job's peak for the first job a process runs
+    if _jobs_run > 1: return None
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == 'darwin' else rss / (1 << 10)
+
+def attach(name):
+    # Map an existing shared-memory block without registering it with a resource tracker, which would
+    # unlink the parent's block when this process exits
+    try: return shared_memory.SharedMemory(name, track=False)  # Python 3.13+
+    except TypeError: pass
+    register, resource_tracker.register = resource_tracker.register, lambda *args: None
+    try: return shared_memory.SharedMemory(name)
+    finally: resource_tracker.register = register
+
+_attached = {{}}  # shared-memory name -> (block, grid views), most recently used last
+
+def load_grids(name):
+    # Views of a task's packed grids, attaching to its block on first use (warm workers reuse it across attempts)
+    if name not in _attached:
+        while len(_attached) >= 8:
+            shm = _attached.pop(next(iter(_attached)))[0]
+            try: shm.close()
+            except BufferError: pass  # Solution code still holds a view; the mapping goes away with the process
+        shm = attach(name)
+        _attached[name] = (shm, unpack_grids(shm.buf))
+    _attached[name] = _attached.pop(name)
+    return _attached[name][1]
+
+def pack_predictions(result):
+    # Send predicted grids back in the compact `pack_grids` layout rather than as pickled `ArcGrid`s
+    preds = result.pop('reconstructed_inputs') + result.pop('predicted_outputs')
+    result['present'] = [p is not None for p in preds]
+    result['grids'] = pack_grids([p for p in preds if p is not None])
+
+def run_examples(InputModel, OutputModel, examples, example_timeout=None):
+    reconstructed_inputs, predicted_outputs = [], []
+    example_errors, example_timings, limit = [], [], None
+    
+    for i, (input_arr, expected_arr) in enumerate(examples):
+        t = {{}}
+        example_timings.append(t)
+        if example_timeout: signal.setitimer(signal.ITIMER_REAL, example_timeout)
+        try:
             try:
                 # print(f"Processing example {{i}}", file=sys.stderr)  # Debug print
-                input_model = InputModel.from_array(input_arr)
-                reconstructed_input = input_model.to_array()
+                input_model = timed(t, 'from_array', InputModel.from_array, input_arr)
+                reconstructed_input = timed(t, 'input_to_array', input_model.to_array)
                 reconstructed_inputs.append(ArcGrid(reconstructed_input))
             except Exception as e:
                 # If an example fails, append None for its results
                 reconstructed_inputs.append(None)
                 predicted_outputs.append(None)
                 example_errors.append(_format_error())
+                limit = limit or _limit_hit(e)
                 continue
             try:
-                output_model = OutputModel.from_input(input_model)
-                prediction = output_model.to_array()
+                output_model = timed(t, 'from_input', OutputModel.from_input, input_model)
+                prediction = timed(t, 'output_to_array', output_model.to_array)
                 predicted_outputs.append(ArcGrid(prediction))
                 example_errors.append(None)
             except Exception as e:
                 predicted_outputs.append(None)
                 example_errors.append(_format_error())
-        
-        result = {{
-            'reconstructed_inputs': reconstructed_inputs,
-            'predicted_outputs': predicted_outputs,
-            'example_errors': example_errors
-        }}
-        
-    except Exception as e:
-        result = {{'error': _format_error()}}
+                limit = limit or _limit_hit(e)
+        finally:
+            if example_timeout: signal.setitimer(signal.ITIMER_REAL, 0)
     
+    return {{
+        'reconstructed_inputs': reconstructed_inputs,
+        'predicted_outputs': predicted_outputs,
+        'example_errors': example_errors,
+        'example_timings': example_timings,
+        'limit': limit
+    }}
+
+def execute(input_data):
+    global _jobs_run
+    _jobs_run += 1
+    reset = reset_peak_rss()
+    code = IMPORTS + input_data['code']
+    limits = input_data.get('limits') or {{}}
+    exec_time = None
+    
+    try:
+        # Examples are (input index, output index) pairs into the task's shared grids; the solution gets
+        # its own int copy of each input, since the shared cells are read-only
+        grids = load_grids(input_data['grids'])
+        examples = [(grids[i].astype(int), grids[j]) for i, j in input_data['examples']]
+        apply_limits(limits)
+        signal.signal(signal.SIGALRM, _raise_example_timeout)
+        # Set up line cache for better tracebacks
+        linecache.cache['<solution>'] = (
+            len(code),
+            None,
+            code.splitlines(keepends=True),
+            '<solution>'
+        )
+
+        # Execute the solution code
+        namespace = {{}}
+        start = time.perf_counter()
+        exec(compile(code, '<solution>', 'exec'), namespace)
+        exec_time = time.perf_counter() - start
+        InputModel, OutputModel = namespace['InputModel'], namespace['OutputModel']
+        result = run_examples(InputModel, OutputModel, examples, limits.get('example_timeout'))
+
+        # Test inputs ride along with train jobs, but are only run once every train output is predicted correctly
+        test_inputs = input_data.get('test_inputs')
+        if test_inputs is not None and all(p is not None and np.array_equal(p.data, expected)
+                                           for p, (_, expected) in zip(result['predicted_outputs'], examples)):
+            result['test'] = run_examples(InputModel, OutputModel, [(grids[i].astype(int), None) for i in test_inputs],
+                                          limits.get('example_timeout'))
+            pack_predictions(result['test'])
+        pack_predictions(result)
+
+    except Exception as e:
+        result = {{'error': _format_error(), 'limit': _limit_hit(e)}}
+
+    result.update(exec_time=exec_time, peak_rss_mb=peak_rss_mb(reset))
+    return result
+
+def dump_result(result, input_data):
+    # Pickle a result, replacing it with an error if it is bigger than the output limit
+    payload = pickle.dumps(result)
+    max_mb = (input_data.get('limits') or {{}}).get('max_output_mb')
+    if max_mb and len(payload) > (limit := int(max_mb * (1 << 20))):
+        payload = pickle.dumps({{'error': f"Result of {{len(payload):,}} bytes exceeds the {{limit:,}} byte ({{max_mb:g}} MB) output limit",
+                                'limit': 'output'}})
+    return payload
+
+def run_solution():
+    # Load input data efficiently from stdin
+    input_data = pickle.load(sys.stdin.buffer)
+    result = execute(input_data)
+
     # Write results efficiently to stdout
-    pickle.dump(result, sys.stdout.buffer)
+    sys.stdout.buffer.write(dump_result(result, input_data))
     sys.stdout.buffer.flush()
 
+def serve():
+    # Keep a private handle on the real stdout for results; anything the solution code prints goes to stderr
+    out = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    # Pay the import cost once, then signal readiness with an empty frame
+    exec(IMPORTS, {{}})
+    out.write(struct.pack('<Q', 0))
+    out.flush()
+
+    # Each job is a length-prefixed pickle of the same input data `run_solution` reads from stdin
+    while len(header := sys.stdin.buffer.read(8)) == 8:
+        input_data = pickle.loads(sys.stdin.buffer.read(struct.unpack('<Q', header)[0]))
+        payload = dump_result(execute(input_data), input_data)
+        out.write(struct.pack('<Q', len(payload)) + payload)
+        out.flush()
+
+def fork_server():
+    out = os.fdopen(os.dup(1), 'wb')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    def send(job_id, status, data):
+        payload = pickle.dumps((job_id, status, data))
+        out.write(struct.pack('<Q', len(payload)) + payload)
+        out.flush()
+
+    # Import everything once; forked children share these pages copy-on-write
+    exec(IMPORTS, {{}})
+    out.write(struct.pack('<Q', 0))
+    out.flush()
+
+    children = {{}}  # result pipe fd -> [job_id, pid, deadline, chunks, timeout]
+    inbuf, stdin_open = b'', True
+    while stdin_open or children:
+        deadlines = [c[2] for c in children.values()]
+        wait = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+        ready, _, _ = select.select([0] * stdin_open + list(children), [], [], wait)
+
+        if 0 in ready:
+            data = os.read(0, 1 << 16)
+            stdin_open, inbuf = bool(data), inbuf + data
+            while len(inbuf) >= 8 and len(inbuf) >= 8 + (n := struct.unpack('<Q', inbuf[:8])[0]):
+                job_id, input_data = pickle.loads(inbuf[8:8 + n])
+                inbuf = inbuf[8 + n:]
+                if input_data is not None:
+                    # Map the task's grids here, so forked children inherit the mapping
+                    try: load_grids(input_data['grids'])
+                    except Exception: pass
+                else:  # Cancellation: kill the job's child if it is still running
+                    for fd in [fd for fd, c in children.items() if c[0] == job_id]:
+                        pid = children.pop(fd)[1]
+                        os.kill(pid, signal.SIGKILL)
+                        os.waitpid(pid, 0)
+                        os.close(fd)
+                        send(job_id, 'cancelled', None)
+                    continue
+                r, w = os.pipe()
+                pid = os.fork()
+                if pid == 0:  # Child: run the solution and write the pickled result to our pipe
+                    os.close(r)
+                    try:
+                        with os.fdopen(w, 'wb') as f: f.write(dump_result(execute(input_data), input_data))
+                    except BaseException: os._exit(1)
+                    os._exit(0)
+                os.close(w)
+                timeout = input_data['limits']['timeout']
+                children[r] = [job_id, pid, time.monotonic() + timeout, [], timeout]
+
+        for fd in ready:
+            if fd == 0: continue
+            chunk = os.read(fd, 1 << 16)
+            if chunk:
+                children[fd][3].append(chunk)
+                continue
+            job_id, pid, _, chunks, _ = children.pop(fd)
+            os.close(fd)
+            status = os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+            if status == 0: send(job_id, 'ok', b''.join(chunks))
+            else: send(job_id, 'exit', status)
+
+        for fd in [fd for fd, c in children.items() if c[2] <= time.monotonic()]:
+            job_id, pid, _, _, timeout = children.pop(fd)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            os.close(fd)
+            send(job_id, 'timeout', timeout)
+
 IMPORTS = '''{}'''
 
 if __name__ == '__main__':
-    run_solution()
+    if '--serve' in sys.argv: serve()
+    elif '--fork-server' in sys.argv: fork_server()
+    else: run_solution()
 """.format(IMPORTS)
 
+    @staticmethod
+    def _input_data(sol: Solution, task: ArcTask, split: str, limits: Optional[ExecutionLimits] = None) -> dict:
+        "Build the job payload sent to a sandbox process"
+        # Grids travel through the task's shared-memory block, so the job only names grid indices
+        n_train, n_test = len(task.train), len(task.test)
+        examples = range(n_train) if split == 'train' else range(n_train, n_train + n_test)
+        input_data = {
+            'code': sol.full_code,
+            'grids': SharedGrids.for_task(task).name,
+            'examples': [(2 * i, 2 * i + 1) for i in examples],
+            'limits': asdict(limits or ExecutionLimits())
+        }
+        # The sandbox predicts the test outputs in the same job once all train outputs are correct
+        if split == 'train': input_data['test_inputs'] = [2 * i for i in range(n_train, n_train + n_test)]
+        return input_data
+
+    @staticmethod
+    def _parse_result(result: dict) -> ExecutionResult:
+        "Convert the result dict returned by a sandbox process into an `ExecutionResult`"
+        if 'error' in result:
+            return ExecutionResult(error=result['error'], limit=result.get('limit'),
+                                   exec_time=result.get('exec_time'), peak_rss_mb=result.get('peak_rss_mb'))
+        grids = iter(unpack_grids(result['grids']))
+        preds = [ArcGrid.intern(ArcGrid.trusted(next(grids))) if present else None for present in result['present']]
+        return ExecutionResult(
+            in_preds=preds[:len(preds) // 2],
+            out_preds=preds[len(preds) // 2:],
+            example_errors=result.get('example_errors'),
+            limit=result.get('limit'),
+            exec_time=result.get('exec_time'),
+            example_timings=result.get('example_timings'),
+            peak_rss_mb=result.get('peak_rss_mb'),
+            test=SandboxedExecutor._parse_result(result['test']) if 'test' in result else None
+        )
+
+    @staticmethod
+    def _timed_out(timeout: float) -> ExecutionResult:
+        return ExecutionResult(error=f"Execution timed out after {timeout:g} seconds", limit='timeout')
+
+    @staticmethod
+    def _failed(code: int, detail: str = '') -> ExecutionResult:
+        "Result for a sandbox process that died with exit `code`"
+        if code == -signal.SIGXCPU: return ExecutionResult(error="Execution exceeded its CPU time limit", limit='cpu')
+        return ExecutionResult(error=f"Process failed with exit code {code}{detail}")
+
     @classmethod
     def run(cls,
-            sol: Solution,         # LLM-generated solution code
-            task: ArcTask,         # The ARC task object
-            split: str = 'train',  # 'train' or 'test'
+            sol: Solution,                            # LLM-generated solution code
+            task: ArcTask,                            # The ARC task object
+            split: str = 'train',                     # 'train' or 'test'
+            job: Optional[SandboxJob] = None,         # Handle used to kill the process if the job is cancelled
+            limits: Optional[ExecutionLimits] = None  # Resource limits (defaults to `ExecutionLimits()`)
            ) -> ExecutionResult:
         "Execute solution attempt in a separate Python process and return reconstructed inputs, predictions, and execution status"
         
@@ -460,12 +843,9 @@ if __name__ == '__main__':
         
         try:
             # Prepare input data
-            examples = task.train if split == 'train' else task.test
-            input_data = {
-                'code': sol.full_code,
-                'examples': [(ex.input.data, ex.output.data) for ex in examples]
-            }
-            
+            limits = limits or ExecutionLimits()
+            input_data = cls._input_data(sol, task, split, limits)
+
             # Run solution process with pipe communication
             process = subprocess.Popen(
                 ["python", runner_path],
@@ -477,68 +857,391 @@ if __name__ == '__main__':
             # Send input data through pipe
             pickle.dump(input_data, process.stdin)
             process.stdin.flush()
+            if job is not None: job.attach(process.kill)
             
             try:
                 # Wait for result with timeout
-                stdout, stderr = process.communicate(timeout=5)
+                stdout, stderr = process.communicate(timeout=limits.timeout)
                 
+                if job is not None and job.cancelled:
+                    return ExecutionResult(error="Execution cancelled")
                 if process.returncode == 0:
                     # Load results
-                    result = pickle.loads(stdout)
-                    
-                    if 'error' in result:
-                        return ExecutionResult(error=result['error'])
-                    else:
-                        return ExecutionResult(
-                            in_preds=result['reconstructed_inputs'],
-                            out_preds=result['predicted_outputs'],
-                            example_errors=result.get('example_errors')
-                        )
+                    return cls._parse_result(pickle.loads(stdout))
                 else:
-                    return ExecutionResult(
-                        error=f"Process failed with exit code {process.returncode}\n{stderr.decode()}"
-                    )
+                    return cls._failed(process.returncode, f"\n{stderr.decode()}")
                     
             except subprocess.TimeoutExpired:
                 process.kill()
-                return ExecutionResult(error="Execution timed out after 5 seconds")
+                return cls._timed_out(limits.timeout)
                 
         finally:
+            if job is not None: job.attach(None)
             # Clean up runner script
             Path(runner_path).unlink()
 
-# %% ../nbs/03_solve.ipynb 39
-def _run_single_attempt(args):
-    "Helper function to run a single attempt (must be at module level for pickling)"
-    return SandboxedExecutor().run(*args)
+# %% ../nbs/03_solve.ipynb 43
+def _read_frame(fd: int, deadline: Optional[float] = None) -> bytes:
+    "Read one length-prefixed frame from file descriptor `fd`, raising `TimeoutError` once `deadline` (if any) passes"
+    def read_exact(n):
+        buf = bytearray()
+        while len(buf) < n:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]: raise TimeoutError
+            chunk = os.read(fd, n - len(buf))
+            if not chunk: raise EOFError("Sandbox process closed its output")
+            buf += chunk
+        return bytes(buf)
+    return read_exact(struct.unpack('<Q', read_exact(8))[0])
+
+
+class SandboxWorker:
+    "A long-lived sandbox process that has already run `SandboxedExecutor.IMPORTS` and executes jobs sent over a pipe"
+    def __init__(self,
+                 max_jobs: int = 50,            # Recycle the process after this many jobs
+                 startup_timeout: float = 60,   # Seconds allowed for the process to finish its imports
+                ):
+        self.max_jobs, self.startup_timeout = max_jobs, startup_timeout
+        self.process, self.n_jobs, self.ready = None, 0, False
+
+    def start(self):
+        "Launch the worker process; it warms up its imports in the background"
+        self.process = subprocess.Popen(
+            ["python", "-c", SandboxedExecutor.RUNNER_SCRIPT, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.n_jobs, self.ready = 0, False
+        return self
+
+    def close(self) -> Optional[int]:
+        "Kill the worker process (if any) and return its exit code"
+        if self.process is None: return None
+        if self.process.poll() is None: self.process.kill()
+        returncode = self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout): stream.close()
+        self.process = None
+        return returncode
+
+    def run(self,
+            input_data: dict,                 # Job payload from `SandboxedExecutor._input_data`
+            job: Optional[SandboxJob] = None  # Handle used to kill the process if the job is cancelled
+           ) -> ExecutionResult:
+        "Send a job to the worker and wait for its result, recycling the process on crash, timeout or after `max_jobs` jobs"
+        if self.process is None or self.process.poll() is not None:
+            self.close()
+            self.start()
+        fd, timeout = self.process.stdout.fileno(), input_data['limits']['timeout']
+        if job is not None: job.attach(self.process.kill)
+        try:
+            if not self.ready:
+                _read_frame(fd, time.monotonic() + self.startup_timeout)
+                self.ready = True
+            payload = pickle.dumps(input_data)
+            self.process.stdin.write(struct.pack('<Q', len(payload)) + payload)
+            self.process.stdin.flush()
+            result = pickle.loads(_read_frame(fd, time.monotonic() + timeout))
+        except TimeoutError:
+            self.close()
+            return SandboxedExecutor._timed_out(timeout)
+        except (EOFError, OSError, pickle.UnpicklingError):
+            code = self.close()
+            if job is not None and job.cancelled: return ExecutionResult(error="Execution cancelled")
+            return SandboxedExecutor._failed(code)
+        finally:
+            if job is not None: job.attach(None)
+
+        self.n_jobs += 1
+        if self.n_jobs >= self.max_jobs: self.close()
+        return SandboxedExecutor._parse_result(result)
 
+
+class WarmWorkerPool:
+    "A pool of warm `SandboxWorker`s that execute ARC solutions without paying interpreter start-up and import costs per attempt"
+    def __init__(self,
+                 n_workers: Optional[int] = None,  # Number of worker processes (None defaults to CPU count)
+                 max_jobs: int = 50,               # Recycle each worker after this many jobs
+                ):
+        self.n_workers = n_workers or os.cpu_count()
+        self._idle = queue.SimpleQueue()
+        for _ in range(self.n_workers): self._idle.put(SandboxWorker(max_jobs).start())
+
+    def run(self,
+            sol: Solution,                            # LLM-generated solution code
+            task: ArcTask,                            # The ARC task object
+            split: str = 'train',                     # 'train' or 'test'
+            job: Optional[SandboxJob] = None,         # Handle used to kill the worker's process if the job is cancelled
+            limits: Optional[ExecutionLimits] = None  # Resource limits (defaults to `ExecutionLimits()`)
+           ) -> ExecutionResult:
+        "Execute a solution on the next idle worker (blocks until one is free)"
+        worker = self._idle.get()
+        try: return worker.run(SandboxedExecutor._input_data(sol, task, split, limits), job)
+        finally: self._idle.put(worker)
+
+    def close(self):
+        "Shut down all idle workers"
+        while not self._idle.empty(): self._idle.get().close()
+
+class ForkServer:
+    "A sandbox process that imports `SandboxedExecutor.IMPORTS` once, then forks a fresh copy-on-write child for every solution"
+    def __init__(self):
+        self.process = None
+        self._lock, self._ids = threading.Lock(), itertools.count()
+
+    def start(self):
+        "Launch the server process and a thread that routes its results back to waiting callers"
+        self.process = subprocess.Popen(
+            ["python", "-c", SandboxedExecutor.RUNNER_SCRIPT, "--fork-server"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # Its own process group, so `close` can kill forked children along with it
+        )
+        self._pending = {}  # job id -> `Future` awaiting its `ExecutionResult`
+        threading.Thread(target=self._read_results, args=(self.process, self._pending), daemon=True).start()
+        return self
+
+    def _read_results(self, process: subprocess.Popen, pending: dict):
+        fd = process.stdout.fileno()
+        try:
+            _read_frame(fd)  # Imports done
+            while True:
+                job_id, status, data = pickle.loads(_read_frame(fd))
+                if status == 'ok': res = SandboxedExecutor._parse_result(pickle.loads(data))
+                elif status == 'timeout': res = SandboxedExecutor._timed_out(data)
+                elif status == 'cancelled': res = ExecutionResult(error="Execution cancelled")
+                else: res = SandboxedExecutor._failed(data)
+                with self._lock: pending.pop(job_id).set_result(res)
+        except (EOFError, OSError):
+            with self._lock:
+                for fut in pending.values():
+                    fut.set_result(ExecutionResult(error=f"Fork server exited with code {process.wait()}"))
+                pending.clear()
+
+    def run(self,
+            sol: Solution,                            # LLM-generated solution code
+            task: ArcTask,                            # The ARC task object
+            split: str = 'train',                     # 'train' or 'test'
+            job: Optional[SandboxJob] = None,         # Handle used to kill the child if the job is cancelled
+            limits: Optional[ExecutionLimits] = None  # Resource limits (defaults to `ExecutionLimits()`)
+           ) -> ExecutionResult:
+        "Execute a solution in a freshly forked child of the server and wait for its result"
+        fut = Future()
+        with self._lock:
+            if self.process is None or self.process.poll() is not None: self.start()
+            job_id = next(self._ids)
+            self._pending[job_id] = fut
+            payload = pickle.dumps((job_id, SandboxedExecutor._input_data(sol, task, split, limits)))
+            try:
+                self.process.stdin.write(struct.pack('<Q', len(payload)) + payload)
+                self.process.stdin.flush()
+            except OSError:
+                self._pending.pop(job_id, None)
+                return ExecutionResult(error="Fork server is not accepting jobs")
+        if job is None: return fut.result()
+        job.attach(lambda: self._cancel(job_id))
+        try: return fut.result()
+        finally: job.attach(None)
+
+    def _cancel(self, job_id: int):
+        "Ask the server to kill the child running `job_id` (a no-op if it has already finished)"
+        payload = pickle.dumps((job_id, None))
+        with self._lock:
+            if job_id not in self._pending or self.process is None: return
+            try:
+                self.process.stdin.write(struct.pack('<Q', len(payload)) + payload)
+                self.process.stdin.flush()
+            except OSError: pass
+
+    def close(self):
+        "Shut down the server process and any children still running jobs (whose timeouts only the server enforces)"
+        if self.process is None: return
+        try: os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError: pass
+        self.process.wait()
+        self.process.stdin.close()
+        self.process = None
+
+# %% ../nbs/03_solve.ipynb 57
+class ExecutionCache:
+    "Content-addressed LRU cache of `ExecutionResult`s, with an optional on-disk store"
+    # Errors produced by the sandbox itself rather than by the solution code
+    SANDBOX_ERRORS = ("Process failed", "Execution cancelled", "Fork server")
+
+    def __init__(self,
+                 maxsize: int = 1024,            # Max number of results kept in memory (0 disables caching)
+                 path: str | Path | None = None  # Optional directory to persist results in
+                ):
+        self.maxsize, self.path = maxsize, Path(path) if path is not None else None
+        if self.path is not None: self.path.mkdir(parents=True, exist_ok=True)
+        self._results, self._lock = LRUCache(maxsize), threading.Lock()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def _code_hash(code: str) -> str:
+        "Hash of the code's AST, so formatting and comments don't matter (falls back to the raw text if it doesn't parse)"
+        try: code = ast.dump(ast.parse(code))
+        except (SyntaxError, ValueError): pass
+        return hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _grids_hash(examples: List[ArcPair]) -> str:
+        "Hash of the shapes and contents of every input/output grid"
+        h = hashlib.blake2b(digest_size=16)
+        for ex in examples:
+            for g in (ex.input, ex.output):
+                h.update(g.fingerprint)
+        return h.hexdigest()
+
+    def key(self, sol: Solution, task: ArcTask, split: str = 'train') -> str:
+        "Cache key for running `sol` on the `split` examples of `task`"
+        # Train jobs also carry the test inputs, so their results depend on both splits
+        examples = task.train + task.test if split == 'train' else task.test
+        return f"{self._code_hash(sol.full_code)}-{self._grids_hash(examples)}"
+
+    @staticmethod
+    def _has_traceback(result: ExecutionResult) -> bool:
+        return result.error is not None or any(e is not None for e in result.example_errors or [])
+
+    def get(self, sol: Solution, task: ArcTask, split: str = 'train') -> Optional[ExecutionResult]:
+        "Look up a stored result, counting a hit or a miss"
+        key, text = self.key(sol, task, split), sol.full_code
+        entry = self._results.get(key)
+        if entry is None and self.path is not None and (f := self.path/f"{key}.pkl").exists():
+            try: entry = pickle.loads(f.read_bytes())
+            except Exception: entry = None
+            if entry is not None: self._results.put(key, entry)
+        # Tracebacks quote line numbers, so only reuse them for identical source
+        if entry is not None and self._has_traceback(entry[1]) and entry[0] != text: entry = None
+        with self._lock:
+            if entry is None: self.misses += 1
+            else: self.hits += 1
+        return None if entry is None else replace(entry[1], cached=True)
+
+    def put(self, sol: Solution, task: ArcTask, split: str, result: ExecutionResult):
+        "Store `result` unless it is a sandbox failure or was cut short by a resource limit"
+        if self.maxsize == 0 or result.limit is not None or (result.error or '').startswith(self.SANDBOX_ERRORS): return
+        key, entry = self.key(sol, task, split), (sol.full_code, result)
+        self._results.put(key, entry)
+        if self.path is not None:
+            tmp = self.path/f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp.write_bytes(pickle.dumps(entry))
+            os.replace(tmp, self.path/f"{key}.pkl")
+
+    @property
+    def hit_rate(self) -> float:
+        "Fraction of lookups answered from the cache"
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+    def clear(self):
+        "Forget all in-memory results and reset the hit/miss counters (the on-disk store is kept)"
+        self._results.clear()
+        with self._lock: self.hits = self.misses = 0
+
+    def __len__(self): return len(self._results)
+    def __repr__(self):
+        return f"ExecutionCache(size={len(self)}, hits={self.hits}, misses={self.misses}, hit_rate={self.hit_rate:.1%})"
+
+# %% ../nbs/03_solve.ipynb 60
 class ConcurrentExecutor:
-    "Executes multiple ARC solution attempts concurrently"
+    "Executes multiple ARC solution attempts concurrently, dispatching each one directly to a sandbox process"
     
-    def __init__(self, max_workers: Optional[int] = None):
-        self.max_workers = max_workers
+    def __init__(self,
+                 max_workers: Optional[int] = None,         # Max concurrent processes (None defaults to CPU count)
+                 backend: str = 'subprocess',               # 'subprocess' (fresh interpreter per attempt), 'warm' (`WarmWorkerPool`) or 'fork' (`ForkServer`)
+                 cache: Optional[ExecutionCache] = None,    # Result cache (None for a fresh in-memory `ExecutionCache`)
+                 limits: Optional[ExecutionLimits] = None,  # Default resource limits for each attempt
+                ):
+        if backend not in ['subprocess', 'warm', 'fork']:
+            raise ValueError("`backend` must be one of 'subprocess', 'warm' or 'fork'")
+        self.max_workers, self.backend = max_workers or os.cpu_count(), backend
+        if backend == 'warm': self.runner = WarmWorkerPool(self.max_workers)
+        elif backend == 'fork': self.runner = ForkServer().start()
+        else: self.runner = SandboxedExecutor
+        self.cache = cache if cache is not None else ExecutionCache()
+        self.limits = limits or ExecutionLimits()
+        # The scheduler's threads only wait on sandbox processes, so each attempt costs a single process
+        self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sandbox')
+
+    def submit(self, sol: Solution, task: ArcTask, split: str = 'train', limits: Optional[ExecutionLimits] = None) -> Future:
+        "Schedule a single attempt, returning a `Future` for its `ExecutionResult`"
+        job = SandboxJob()
+        if (cached := self.cache.get(sol, task, split)) is not None:
+            fut = Future()
+            fut.set_result(cached)
+        else: fut = self._threads.submit(self._run, sol, task, split, job, limits or self.limits)
+        fut.job = job
+        return fut
+
+    def _run(self, sol: Solution, task: ArcTask, split: str, job: SandboxJob, limits: ExecutionLimits) -> ExecutionResult:
+        result = self.runner.run(sol, task, split, job, limits)
+        self.cache.put(sol, task, split, result)
+        return result
+
+    def cancel(self, fut: Future):
+        "Cancel a submitted attempt: drop it if it hasn't started yet, otherwise kill its sandbox process"
+        fut.cancel()
+        fut.job.cancel()
     
-    def run_attempts(self, sols: List[Solution], task: ArcTask, split: str) -> List[ExecutionResult]:
+    def run_attempts(self, sols: List[Solution], task: ArcTask, split: str, limits: Optional[ExecutionLimits] = None) -> List[ExecutionResult]:
         "Run in parallel"
-        # Create list of (sol, task, split) tuples for each sol
-        args = [(sol, task, split) for sol in sols]
-        
-        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
-            # Map the run function over the arguments
-            results = list(pool.map(_run_single_attempt, args))
-        return results
+        futures = [self.submit(sol, task, split, limits) for sol in sols]
+        return [f.result() for f in futures]
+
+    def close(self):
+        "Stop the scheduler and shut down any sandbox processes it owns"
+        self._threads.shutdown()
+        if self.runner is not SandboxedExecutor: self.runner.close()
 
-# %% ../nbs/03_solve.ipynb 40
+    _shared = {}
+
+    @classmethod
+    def shared(cls,
+               max_workers: Optional[int] = None,  # Max concurrent processes (None defaults to CPU count)
+               backend: str = 'subprocess',        # 'subprocess', 'warm' or 'fork'
+              ) -> 'ConcurrentExecutor':
+        "Get the process-wide executor for these settings, creating it on first use"
+        key = (max_workers or os.cpu_count(), backend)
+        if key not in cls._shared:
+            cls._shared[key] = cls(*key)
+            atexit.register(cls._shared[key].close)
+        return cls._shared[key]
+
+# %% ../nbs/03_solve.ipynb 61
 def run_solutions(sols: List[Solution],           # List of `Solution` objects to execute
                   task: ArcTask,                  # ARC task to test against
                   split: str = 'train',           # 'train' or 'test'
-                  max_workers: int | None = None  # Max concurrent processes (None defaults to CPU count)
+                  max_workers: int | None = None, # Max concurrent processes (None defaults to CPU count)
+                  backend: str = 'subprocess',    # 'subprocess', 'warm' or 'fork'
+                  executor: ConcurrentExecutor | None = None, # Executor to reuse (defaults to the shared one for `max_workers`/`backend`)
+                  limits: ExecutionLimits | None = None       # Resource limits for each attempt (defaults to the executor's)
                   ) -> List[ExecutionResult]:     # List of `ExecutionResult` objects, one per attempt
     "Executes multiple solution attempts concurrently."
-    executor = ConcurrentExecutor(max_workers=max_workers)
-    return executor.run_attempts(sols, task, split)
-
-# %% ../nbs/03_solve.ipynb 44
+    executor = executor or ConcurrentExecutor.shared(max_workers, backend)
+    return executor.run_attempts(sols, task, split, limits)
+
+# %% ../nbs/03_solve.ipynb 66
+async def run_solutions_async(
+    sols: List[Solution],                       # List of `Solution` objects to execute
+    task: ArcTask,                              # ARC task to test against
+    split: str = 'train',                       # 'train' or 'test'
+    max_workers: int | None = None,             # Max concurrent processes (None defaults to CPU count)
+    backend: str = 'subprocess',                # 'subprocess', 'warm' or 'fork'
+    executor: ConcurrentExecutor | None = None, # Executor to reuse (defaults to the shared one for `max_workers`/`backend`)
+    limits: ExecutionLimits | None = None       # Resource limits for each attempt (defaults to the executor's)
+) -> List[ExecutionResult]:                     # List of `ExecutionResult` objects, one per attempt
+    "Executes multiple solution attempts concurrently without blocking the event loop."
+    executor = executor or ConcurrentExecutor.shared(max_workers, backend)
+    futures = [executor.submit(sol, task, split, limits) for sol in sols]
+    try: return await asyncio.gather(*[asyncio.wrap_future(f) for f in futures])
+    except asyncio.CancelledError:
+        # Don't leave sandbox processes running for results nobody is waiting on
+        for f in futures: executor.cancel(f)
+        raise
+
+# %% ../nbs/03_solve.ipynb 71
 @patch(as_prop=True)
 def score(self: Attempt) -> float:
     if self.result is not None and self.result.error is None:
@@ -549,22 +1252,17 @@ def score(self: Attempt) -> float:
     else:
         return 0.0
 
-# %% ../nbs/03_solve.ipynb 49
-def _already_shown_task(chat_hist, task):
-    for m in chat_hist:
-        if isinstance(m, dict) and m['role'] == 'user':
-            for d in m['content']:
-                if isinstance(d, dict) and 'source' in d.keys():
-                    if d['source']['data'] == base64.b64encode(task.plot(to_base64=True)).decode("utf-8"):
-                        return True
-    return False
-
-# %% ../nbs/03_solve.ipynb 50
+# %% ../nbs/03_solve.ipynb 76
+def _already_shown_task(index: HistoryIndex, task):
+    # The task image's base64 string comes from `render_cache`, so this is a set lookup with no re-rendering
+    return render_cache.b64(task.plot(to_base64=True)) in index.images
+
+# %% ../nbs/03_solve.ipynb 78
 def _image_message(l: list,               # list of indexes corresponding to candidate plots
                    res: ExecutionResult,  # Result of running execution
                    in_out: str,           # 'input' or 'output'
                    task: ArcTask,   # ARC task being solved
-                   hist: list,      # Chat history
+                   index: HistoryIndex,  # Index of the chat history
                   ) -> tuple[str]:  # image and message specifying what image is attached
     "Construct message describing attached image"
     idx = random.choice(range(len(l)))
@@ -573,7 +1271,7 @@ def _image_message(l: list,               # list of indexes corresponding to can
                  ).plot(titles=['Input' if in_out == 'input' else 'Output',
                                 'Reconstructed' if in_out == 'input' else 'Predicted'], to_base64=True)
 
-    if not _already_shown_task(hist, task): fb = "\nAttached is an image of the full task and also an image showing the true "
+    if not _already_shown_task(index, task): fb = "\nAttached is an image of the full task and also an image showing the true "
     else: fb = "\nAttached is an image of the true "
 
     
@@ -582,7 +1280,16 @@ def _image_message(l: list,               # list of indexes corresponding to can
            f"{l[idx]+1}.\n")
     return viz, fb
 
-# %% ../nbs/03_solve.ipynb 51
+# %% ../nbs/03_solve.ipynb 79
+_limit_feedback = {
+    'timeout': "Your solution ran out of time. Make sure it can't loop forever and avoid brute-force searches.",
+    'example_timeout': ("Your solution took too long on at least one example. Make sure it can't loop forever "
+                        "and avoid brute-force searches."),
+    'cpu': "Your solution used too much CPU time. Avoid brute-force searches and needlessly repeated work.",
+    'memory': "Your solution ran out of memory. Avoid allocating huge arrays or building unbounded collections.",
+    'output': "Your solution produced an unreasonably large result. Make sure your models only build grid-sized arrays.",
+}
+
 def feedback(attempt: Attempt,  # Incorrect attempt
             ) -> list:          # feedback prompt for claudette, maybe including an image of an incorrect prediction
     "Generate feedback message for Claude based on execution results"
@@ -592,8 +1299,10 @@ def feedback(attempt: Attempt,  # Incorrect attempt
              "with <new_primitives>, <input_model> and <output_model>.")
 
     res, task, chat = attempt.result, attempt.task, attempt.chat
+    index = attempt.history.update(chat.h) if chat is not None else attempt.history
+    limit_fb = _limit_feedback[res.limit] + "\n" if res.limit in _limit_feedback else ""
     if res.error is not None:
-        return [f"Attempting to execute your solution resulted in the following error:\n```\n{res.error}\n```\n" + retry]
+        return [f"Attempting to execute your solution resulted in the following error:\n```\n{res.error}\n```\n" + limit_fb + retry]
     
     fb = ""
     in_correct, in_incorrect, out_correct, out_incorrect = [], [], [], []
@@ -668,45 +1377,40 @@ def feedback(attempt: Attempt,  # Incorrect attempt
     if any(res.out_preds):  # At least one output was generated
         if out_correct and out_incorrect:
             # Mix of correct/incorrect outputs -> show incorrect output
-            viz, msg = _image_message(out_incorrect, res, 'output', task, chat.h)
+            viz, msg = _image_message(out_incorrect, res, 'output', task, index)
             fb += msg
         elif not out_correct:  # no correct outputs
             if all(r == task.train[i].input for i, r in enumerate(res.in_preds) if r is not None):
                 # Inputs all correct -> show incorrect output
-                viz, msg = _image_message(out_incorrect, res, 'output', task, chat.h)
+                viz, msg = _image_message(out_incorrect, res, 'output', task, index)
                 fb += msg
             elif in_incorrect:
                 # Some inputs incorrect -> show incorrect input
-                viz, msg = _image_message(in_incorrect, res, 'input', task, chat.h)
+                viz, msg = _image_message(in_incorrect, res, 'input', task, index)
                 fb += msg
     else:  # No outputs were generated
         if in_incorrect:
             # Show incorrect input if we have any
-            viz, msg = _image_message(in_incorrect, res, 'input', task, chat.h)
+            viz, msg = _image_message(in_incorrect, res, 'input', task, index)
             fb += msg
 
+    fb += ("\n" + limit_fb) if limit_fb else ""
     if viz is not None: retry += ("\nIMPORTANT: Remember the core principles! Do not implement example-specific logic "
                                   "or rules based on this image.")
-    if _already_shown_task(chat.h, task): return [viz, fb + retry] if viz is not None else [fb + retry]
+    if _already_shown_task(index, task): return [viz, fb + retry] if viz is not None else [fb + retry]
     else: return [task.plot(to_base64=True), viz, fb + retry] if viz is not None else [fb + retry]
 
-
-# %% ../nbs/03_solve.ipynb 53
-def clear_cache(hist: list  # chat history
+# %% ../nbs/03_solve.ipynb 82
+def clear_cache(hist: list,  # chat history
+                index: Optional[HistoryIndex] = None  # Index of `hist` (built from scratch if not given)
                ) -> list:
     "Make sure there are at most 3 cache points in a conversation history"
-    num_caches = 0
-    for x in hist[::-1]:
-        if isinstance(x, dict):
-            if not isinstance(x['content'], list): print('expected list')
-            for y in x['content']:
-                if isinstance(y, dict):
-                    if 'cache_control' in y:
-                        num_caches += 1
-                        if num_caches >= 4: del y['cache_control']
+    index = (index or HistoryIndex()).update(hist)
+    for i, j in index.breakpoints[:-3]: hist[i]['content'][j].pop('cache_control', None)
+    del index.breakpoints[:-3]
     return hist
 
-# %% ../nbs/03_solve.ipynb 54
+# %% ../nbs/03_solve.ipynb 84
 async def retry_solution(
     attempt: Attempt,                           # Previous (incorrect) attempt
     model: str = 'claude-3-5-sonnet-20241022',  # Model identifier (defaults to Sonnet 3.5)
@@ -723,7 +1427,8 @@ async def retry_solution(
 
     client = _create_client(client_type, client_kwargs)
     chat = _create_chat(model, client, sp)
-    chat.h = clear_cache(attempt.chat.h.copy()) if client_type=='anthropic' else attempt.chat.h.copy()
+    index = attempt.history.update(attempt.chat.h).copy()
+    chat.h = clear_cache(attempt.chat.h.copy(), index) if client_type=='anthropic' else attempt.chat.h.copy()
 
     fb = feedback(attempt)
 
@@ -731,15 +1436,15 @@ async def retry_solution(
         r = await chat.codeloop(
             mk_msg(fb, cache=client_type=='anthropic'), prefill=prefill, stop='</output_model>', temp=temp, max_attempts=max_attempts, **kwargs
         )
-        a = Attempt(task=attempt.task, description=attempt.description, depth=attempt.depth + 1, solution=r, chat=chat, parent=attempt)
+        a = Attempt(task=attempt.task, description=attempt.description, depth=attempt.depth + 1, solution=r, chat=chat, parent=attempt, history=index)
         attempt.children.append(a)
         return a
     except Exception as e:
-        a = Attempt(task=attempt.task, description=attempt.description, depth=attempt.depth + 1, solution=None, chat=chat, parent=attempt, error=str(e))
+        a = Attempt(task=attempt.task, description=attempt.description, depth=attempt.depth + 1, solution=None, chat=chat, parent=attempt, history=index, error=str(e))
         attempt.children.append(a)
         return a
 
-# %% ../nbs/03_solve.ipynb 60
+# %% ../nbs/03_solve.ipynb 90
 @dataclass
 class SolutionTree:
     "Store full tree of solution attempts for an ARC task"
@@ -747,6 +1452,7 @@ class SolutionTree:
     roots: List[Attempt]         # List of root attempts (one per description)
     total_cost: float            # Total cost of all attempts
     n_attempts: int              # Total number of attempts
+    n_cancelled: int = 0         # In-flight attempts cancelled once the task was solved
 
     def _collect_attempts(self, root: Attempt) -> List[Attempt]:
         "Recursively collect all attempts in a tree branch"
@@ -765,6 +1471,30 @@ class SolutionTree:
         return [a for a in self.all_attempts 
                 if hasattr(a, 'correct') and a.correct]
     
+    @property
+    def cancelled(self) -> List[Attempt]:
+        "Get attempts whose execution was cancelled once the task was solved (attempts cancelled mid-generation never reach the tree)"
+        return [a for a in self.all_attempts if a.cancelled]
+
+    @property
+    def execution_stats(self) -> Dict[str, Dict[str, float]]:
+        "Mean and max seconds per execution phase (and peak RSS in MB) across all attempts executed in this run (not cache hits)"
+        samples = defaultdict(list)
+        for a in self.all_attempts:
+            if a.result is None or a.result.exec_time is None or a.result.cached: continue
+            samples['exec'].append(a.result.exec_time)
+            for t in a.result.example_timings or []:
+                for phase, secs in t.items(): samples[phase].append(secs)
+            samples['run_time'].append(a.result.run_time)
+            # Reused workers can't always isolate one job's peak, and report None rather than an earlier job's
+            if a.result.peak_rss_mb is not None: samples['peak_rss_mb'].append(a.result.peak_rss_mb)
+        return {k: {'mean': sum(v) / len(v), 'max': max(v), 'n': len(v)} for k, v in samples.items()}
+
+    def slowest(self, n: int = 5) -> List[Attempt]:
+        "The `n` attempts whose solution code took longest to run (timed-out attempts are flagged by `result.limit` instead)"
+        timed = [a for a in self.all_attempts if a.result is not None and a.result.run_time is not None]
+        return sorted(timed, key=lambda a: a.result.run_time, reverse=True)[:n]
+
     @property 
     def best_attempt(self) -> Optional[Attempt]:
         "Get attempt with highest score"
@@ -781,6 +1511,7 @@ class SolutionTree:
         return (f"ArcTask {self.task.task_id} ({status})\n"
                 f"Attempts: {self.n_attempts}\n"
                 f"Correct: {len(self.correct)}\n"
+                f"Cancelled: {self.n_cancelled}\n"
                 f"Best Score: {self.best_score:.3f}\n"
                 f"Total Cost: ${self.total_cost:.3f}")
     __repr__ = __str__
@@ -834,6 +1565,8 @@ class SolutionTree:
                 label_parts.append(f"Cost: ${attempt.chat.cost:.3f}")
             if hasattr(attempt, 'correct') and attempt.correct:
                 label_parts.append("🎉")
+            if attempt.cancelled:
+                label_parts.append("cancelled")
             label = " | ".join(label_parts)
         
         # Create node
@@ -843,7 +1576,7 @@ class SolutionTree:
         for i, child in enumerate(attempt.children):
             self._add_attempt_node(tree, child, attempt_id, i, scores_only)
 
-# %% ../nbs/03_solve.ipynb 62
+# %% ../nbs/03_solve.ipynb 93
 @dataclass
 class SolverProgress:
     "Track progress of ARC task solution attempts"
@@ -861,7 +1594,19 @@ class SolverProgress:
     #             f"Best Score: {self.best_score:.3f} | "
     #             f"Cost: ${self.cost:.3f}")
 
-# %% ../nbs/03_solve.ipynb 63
+@dataclass
+class SolveLimits:
+    "Limits shared by every task solved in one `ArcSolver.solve_many` run"
+    llm_slots: asyncio.Semaphore  # Caps the number of in-flight LLM requests (each request holds a slot while it is sent)
+    max_cost: Optional[float]     # Stop launching new LLM requests once this much (USD) has been spent
+    spent: float = 0.0            # Total cost in USD so far, across all tasks
+
+    @property
+    def exhausted(self) -> bool: return self.max_cost is not None and self.spent >= self.max_cost
+
+    def spend(self, cost: float): self.spent += cost
+
+# %% ../nbs/03_solve.ipynb 94
 class ArcSolver:
     "(Attempt to) Solve an ARC task using Claude."
     def __init__(self,
@@ -871,6 +1616,8 @@ class ArcSolver:
                  describer: Optional[DescriptionGenerator] = None,  # Optional custom description generator
                  solve_sp: Optional[str] = None,             # Custom system prompt for solution generation
                  max_workers: Optional[int] = None,          # Max concurrent processes for execution
+                 backend: str = 'subprocess',                # Execution backend: 'subprocess', 'warm' or 'fork'
+                 limits: Optional[ExecutionLimits] = None,   # Resource limits for each execution (defaults to `ExecutionLimits()`)
                  top_n: int = 2,                             # Number of best attempts to retry from
                  logger: Optional[logging.Logger] = None,    # Optional pre-configured logger
                 ):
@@ -881,6 +1628,9 @@ class ArcSolver:
         self.describer = (describer or DescriptionGenerator(model, client_type, client_kwargs))
         self.solve_sp = solve_sp or sp_solve
         self.max_workers = max_workers
+        self.backend = backend
+        self.executor = ConcurrentExecutor.shared(max_workers, backend)
+        self.limits = limits
         self.top_n = top_n
         # Set up logger if not provided
         if logger is None:
@@ -915,6 +1665,7 @@ class ArcSolver:
         return sum(len(self._collect_attempts(root)) for root in roots)
     
     def _log_progress(self,
+                     task: ArcTask,
                      status: str,
                      roots: List[Attempt],
                      n_attempts: int,
@@ -923,7 +1674,7 @@ class ArcSolver:
                      total_cost: float,
                      correct: bool = False
                     ) -> SolverProgress:
-        "Log progress update and return progress object"
+        "Log progress update, prefixed with the task ID, and return progress object"
         all_attempts = [a for r in roots for a in self._collect_attempts(r) if a.result is not None]
         best_score = max([a.score for a in all_attempts]) if all_attempts else 0.0
         
@@ -938,7 +1689,7 @@ class ArcSolver:
         )
         
         self.logger.info(
-            f"{status} | "
+            f"[{task.task_id}] {status} | "
             f"Attempts: {n_attempts}/{budget} | "
             f"Best Score: {best_score:.3f} | "
             f"Cost: ${total_cost:.3f}"
@@ -946,77 +1697,139 @@ class ArcSolver:
         
         return progress
 
+    def _next_parent(self, roots: List[Attempt], busy: List[Attempt]) -> Optional[Attempt]:
+        "Best of the top n attempts that doesn't already have a retry in flight, if any."
+        return next((a for a in self._get_best_n(roots, self.top_n) if not any(a is b for b in busy)), None)
+
+    @staticmethod
+    def _can_spend(limits: Optional[SolveLimits]) -> bool:
+        "Whether the shared dollar budget (if any) still allows new LLM requests"
+        return limits is None or not limits.exhausted
+
+    async def _run_attempt(self,
+                           gen,                                   # Coroutine returning a new `Attempt` (i.e. `attempt_solution` or `retry_solution`)
+                           task: ArcTask,                         # ARC task being solved
+                           limits: Optional[SolveLimits] = None,  # Limits shared with other tasks, if any
+                          ) -> Attempt:
+        "Generate an attempt, execute it as soon as it arrives and validate it on the test examples if it scores 1.0"
+        a = await gen
+        # Charge the shared budget as soon as the attempt is generated, before its (possibly slow) execution
+        if limits is not None and a.chat is not None: limits.spend(a.chat.cost)
+        if a.solution is None: return a
+        try:
+            a.result = (await run_solutions_async([a.solution], task, executor=self.executor, limits=self.limits))[0]
+            # The train job already predicted the test outputs if every train output was correct
+            r = a.result.test
+            if a.score == 1.0 and r is not None and all(p is not None and p == t.output for p, t in zip(r.out_preds, task.test)):
+                a.correct = True
+        except asyncio.CancelledError:
+            a.cancelled = True
+            raise
+        return a
+
     async def solve(self,
                     task: ArcTask | str,           # ARC task or task ID to solve
                     d_direct: int = 1,             # Number of direct descriptions to generate
                     d_indirect: int = 1,           # Number of indirect descriptions to generate
                     budget: int = 30,              # Maximum number of solution attempts
                     temp: float = 0.7,             # Temperature for generation
+                    limits: Optional[SolveLimits] = None,  # Limits shared with other tasks (`solve_many` passes these)
                     **kwargs                       # Additional kwargs passed to attempt/retry functions
                    ) -> SolutionTree:              # Tree structure of all attempts
         "Generate and iteratively refine solutions until success or budget exhausted."
-        if isinstance(task, str): task = ArcTask(task)
+        if isinstance(task, str): task = registry.get(task)
 
-        self.logger.info(f"\nSolving task: {task.task_id}")
-        roots, n_attempts, total_cost = [], 0, 0.0
+        self.logger.info(f"\n[{task.task_id}] Solving task")
+        roots, n_attempts, total_cost, n_cancelled = [], 0, 0.0, 0
 
-        self._log_progress("Generating descriptions...", roots, n_attempts, 
+        self._log_progress(task, "Generating descriptions...", roots, n_attempts, 
                           budget, 0, total_cost)
 
-        ds = await self.describer.describe_task(task, n_direct=d_direct, n_indirect=d_indirect, temp=temp)
-        total_cost += sum(d.cost for d in ds)
+        # Every LLM request holds one of the shared slots only while it is in flight
+        slots = {} if limits is None else {'slots': limits.llm_slots}
+        ds = await self.describer.describe_task(task, n_direct=d_direct, n_indirect=d_indirect, temp=temp, **slots)
+        total_cost += (cost := sum(d.cost for d in ds))
+        if limits is not None: limits.spend(cost)
     
         roots = [Attempt(task=task, description=d, depth=0) for d in ds]
     
         correct = []
-        self._log_progress("Starting solution attempts...", roots, n_attempts,
+        self._log_progress(task, "Starting solution attempts...", roots, n_attempts,
                           budget, len(ds), total_cost)
-        while n_attempts < budget:
-            if n_attempts == 0:
-                self._log_progress("Generating initial solutions...", 
-                                roots, n_attempts, budget, len(ds), total_cost)
-                attempt_tasks = [attempt_solution(r, self.model, self.client_type, self.client_kwargs, self.solve_sp) for r in roots]
-            else:
-                self._log_progress("Refining previous solutions...", 
-                                roots, n_attempts, budget, len(ds), total_cost)
-                best_n = self._get_best_n(roots, self.top_n)
-                attempt_tasks = [retry_solution(a, self.model, self.client_type, self.client_kwargs) for a in best_n]
-            attempts = await asyncio.gather(*attempt_tasks)
-            total_cost += sum(a.chat.cost for a in attempts if a.chat is not None)
-            # Filter out attempts that failed to generate valid solutions
-            valid_attempts = [a for a in attempts if a.solution is not None]
-            if not valid_attempts:
-                self._log_progress("No valid solutions generated, retrying...", 
-                                roots, n_attempts, budget, len(ds), total_cost)
-                continue
-    
-            # Execute solutions concurrently
-            self._log_progress("Testing solutions...", 
-                            roots, n_attempts, budget, len(ds), total_cost)
-            results = run_solutions([a.solution for a in valid_attempts],
-                                    task, max_workers=self.max_workers)
-            
-            # Update attempts with results
-            for a, r in zip(valid_attempts, results): a.result = r
-            # Check for successful attemps
-            if any(successful := [a for a in valid_attempts if a.score == 1.0]):
-                self._log_progress("Found potential solution, validating...", 
-                                roots, n_attempts, budget, len(ds), total_cost)
-                test_results = run_solutions([a.solution for a in successful], task, 'test', max_workers=self.max_workers)
-                for a, r in zip(successful, test_results):
-                    if r.error is None and all(p == t.output for p, t in zip(r.out_preds, task.test)):
-                        a.correct = True
-                        correct.append(a)
-    
-            n_attempts = self._count_attempts(roots)
-            if not any(correct):
-                if n_attempts > budget:
-                    self._log_progress("Budget exhausted", roots, n_attempts, budget, len(ds), 
-                                       total_cost, bool(correct))
-            else: break
+
+        # Each in-flight job generates, executes and scores one attempt; a new retry is launched as soon as
+        # any job finishes, so no attempt waits on the slowest LLM response
+        in_flight = {}  # asyncio task -> attempt being retried (or root)
+        def launch(parent: Attempt):
+            gen = (attempt_solution(parent, self.model, self.client_type, self.client_kwargs, self.solve_sp, **slots) if parent.depth == 0
+                   else retry_solution(parent, self.model, self.client_type, self.client_kwargs, **slots))
+            in_flight[asyncio.ensure_future(self._run_attempt(gen, task, limits))] = parent
+
+        self._log_progress(task, "Generating initial solutions...", 
+                           roots, n_attempts, budget, len(ds), total_cost)
+        for r in roots[:budget if self._can_spend(limits) else 0]: launch(r)
+        n_launched = len(in_flight)
+
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    del in_flight[t]
+                    a = t.result()
+                    if a.chat is not None: total_cost += a.chat.cost
+                    if getattr(a, 'correct', False): correct.append(a)
+                n_attempts = self._count_attempts(roots)
+                if correct: break
+
+                # Refill up to `top_n` concurrent retries from the best attempts scored so far
+                while n_launched < budget and len(in_flight) < self.top_n and self._can_spend(limits):
+                    parent = self._next_parent(roots, list(in_flight.values()))
+                    if parent is None:
+                        # No scored attempts to refine yet; start afresh from a description once nothing is pending
+                        if in_flight: break
+                        parent = roots[n_launched % len(roots)]
+                    launch(parent)
+                    n_launched += 1
+                self._log_progress(task, "Refining previous solutions..." if in_flight else "Budget exhausted",
+                                   roots, n_attempts, budget, len(ds), total_cost)
+        finally:
+            # Stop the moment an attempt is verified correct: cancel pending LLM calls and kill their sandbox jobs
+            n_cancelled = sum(t.cancel() for t in in_flight)
+            if in_flight:
+                await asyncio.wait(in_flight)
+                # Attempts cancelled mid-execution were still generated, so their tokens count towards the cost
+                total_cost += sum(a.chat.cost for r in roots for a in self._collect_attempts(r) if a.cancelled and a.chat is not None)
+                n_attempts = self._count_attempts(roots)
 
         status = "Solution found! 🎉" if any(correct) else "Failed to find solution."
-        self._log_progress(status, roots, n_attempts, budget, len(ds), 
+        self._log_progress(task, status, roots, n_attempts, budget, len(ds), 
                         total_cost, bool(correct))
         
-        return SolutionTree(task=task, roots=roots, total_cost=total_cost, n_attempts=n_attempts)
+        if n_cancelled: self.logger.info(f"[{task.task_id}] Cancelled {n_cancelled} in-flight attempts")
+        return SolutionTree(task=task, roots=roots, total_cost=total_cost, n_attempts=n_attempts, n_cancelled=n_cancelled)
+
+    async def solve_many(self,
+                         tasks: List[ArcTask | str],              # ARC tasks or task IDs to solve
+                         split: str = 'train',                    # Split to load task IDs from ('train' or 'eval')
+                         max_tasks: int = 4,                      # Max number of tasks being solved at once
+                         max_llm_requests: int = 8,               # Max in-flight LLM requests across all tasks
+                         max_cost: Optional[float] = None,        # Stop launching LLM requests once this much (USD) is spent
+                         **kwargs                                 # Additional kwargs passed to `solve`
+                        ) -> AsyncIterator[SolutionTree]:
+        "Solve many tasks concurrently under global limits, yielding each `SolutionTree` as soon as its task finishes."
+        # Sandbox processes are already capped globally: every task shares `self.executor`
+        pending = [registry.get(t, split) if isinstance(t, str) else t for t in tasks]
+        # Each call gets its own limits, so concurrent `solve_many` calls on one solver don't share them
+        limits = SolveLimits(asyncio.Semaphore(max_llm_requests), max_cost)
+        running = set()
+        try:
+            while pending or running:
+                while pending and len(running) < max_tasks and not limits.exhausted:
+                    running.add(asyncio.ensure_future(self.solve(pending.pop(0), limits=limits, **kwargs)))
+                if not running:
+                    self.logger.info(f"\nSpending limit reached, skipping {len(pending)} remaining tasks")
+                    break
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for t in done: yield t.result()
+        finally:
+            for t in running: t.cancel()
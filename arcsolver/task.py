@@ -3,28 +3,43 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_task.ipynb.
 
 # %% auto 0
-__all__ = ['train_tasks', 'eval_tasks', 'ArcGrid', 'ArcPair', 'ArcTask', 'get_task_files']
+__all__ = ['render_cache', 'registry', 'train_tasks', 'eval_tasks', 'ArcGrid', 'RenderCache', 'pack_grids', 'unpack_grids',
+           'ArcPair', 'ArcTask', 'get_task_files', 'TaskRegistry', 'pack_corpus', 'PackedCorpus']
 
 # %% ../nbs/00_task.ipynb 3
 import os
 import json
+import zlib
+import base64
+import struct
+import mmap
+import hashlib
+import weakref
 import numpy as np
 from pathlib import Path
-from typing import Union, Optional, Literal
+from collections.abc import Sequence
+from typing import Union, Optional, Literal, Callable
 from fastcore.utils import *
-import matplotlib.pyplot as plt
-from matplotlib.transforms import Bbox
-from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
 from io import BytesIO
 import importlib.resources as resources
+from .utils import LRUCache
 
 # %% ../nbs/00_task.ipynb 4
+def _plt():
+    "Import `matplotlib.pyplot` on first use, so data-only users of this module (e.g. sandbox processes) never load it"
+    import matplotlib.pyplot as plt
+    return plt
+
+# %% ../nbs/00_task.ipynb 5
 class ArcGrid:
     "A single ARC grid"
     # Class-level color mapping
     _colors = ['black', 'blue', 'red', 'green', 'yellow', 'grey', 'pink', 'orange', 'cyan', 'brown']
     _color_mapping = {i: color for i, color in enumerate(_colors)}
     
+    __slots__ = ('data', 'shape', '_bytes', '_fp', '__weakref__')
+    _interned = weakref.WeakValueDictionary()  # fingerprint -> canonical grid
+    
     def __init__(self,
                  data: np.ndarray  # 2d array of integers (0–9)
                 ):
@@ -34,33 +49,82 @@ class ArcGrid:
             raise ValueError("Data must be a 2D array")
         if not np.issubdtype(data.dtype, np.integer):
             raise ValueError("Data must contain integers")
-        if not ((data >= 0) & (data <= 9)).all():
-            raise ValueError("Data values must be between 0 and 9")
         if data.shape[0] > 30 or data.shape[1] > 30:
             raise ValueError("Data dimensions cannot exceed 30")
-        
+        # Grids hold at most 900 cells, so two reductions are cheaper than building boolean masks
+        if data.size and (data.min() < 0 or data.max() > 9):
+            raise ValueError("Data values must be between 0 and 9")
+        self._set(data)
+
+    def _set(self, data):
+        data = np.ascontiguousarray(data, dtype=np.uint8)
+        if data.flags.writeable:
+            # The cached bytes and fingerprint would go stale (in every task sharing an interned grid) if the cells changed
+            data = data.view()
+            data.setflags(write=False)
         self.data = data
-        self.shape = data.shape
+        self.shape = self.data.shape
+        self._bytes, self._fp = None, None
+
+    @classmethod
+    def trusted(cls,
+                data: np.ndarray  # 2d array already known to be a valid grid, e.g. one unpacked by `unpack_grids`
+               ) -> 'ArcGrid':
+        "Wrap `data` without validation (no copy if it is already contiguous `uint8`)"
+        grid = cls.__new__(cls)
+        grid._set(data)
+        return grid
+
+    @property
+    def bytes(self) -> bytes:
+        "Raw cell bytes (computed once; grids are treated as immutable)"
+        if self._bytes is None: self._bytes = self.data.tobytes()
+        return self._bytes
+
+    @property
+    def fingerprint(self) -> bytes:
+        "16-byte digest of the shape and cells (computed once)"
+        if self._fp is None:
+            self._fp = hashlib.blake2b(bytes(self.shape) + self.bytes, digest_size=16).digest()
+        return self._fp
+
+    def __hash__(self): return int.from_bytes(self.fingerprint[:8], 'little', signed=True)
+
+    @classmethod
+    def intern(cls,
+               grid: 'ArcGrid|np.ndarray'  # Grid (or 2d array) to intern
+              ) -> 'ArcGrid':
+        "The canonical instance of `grid`, so identical interned grids are the same object"
+        if not isinstance(grid, ArcGrid): grid = cls(grid)
+        return cls._interned.setdefault(grid.fingerprint, grid)
+
+    # Pickle just the cells; the cached bytes and fingerprint are recomputed on demand
+    def __reduce__(self): return (ArcGrid.trusted, (self.data,))
 
     def __str__(self): return f"Grid(shape={self.data.shape})"
     __repr__ = __str__
 
     def plot(self,
-             ax: plt.Axes|None = None,  # matplotlib `Axes` object to plot on
+             ax: 'plt.Axes|None' = None,  # matplotlib `Axes` object to plot on
              title: str|None = None,  # title for the plot
              max_width: int|None = None,  # maximum width for consistent sizing across multiple grids
              max_height: int|None = None,  # maximum height for consistent sizing across multiple grids
              to_base64: bool = False,  # If True, returns plot image as base64 string
+             fast: bool = True,  # Render `to_base64` images with the numpy rasterizer (matplotlib is used if savefig `kwargs` are given)
              **kwargs  # 
             ):
         "Plot a single ARC grid"
+        max_width = self.shape[1] if max_width is None else max_width
+        max_height = self.shape[0] if max_height is None else max_height
+        if ax is None and to_base64 and fast and not kwargs:
+            return render_cache.png(('grid', self.fingerprint, title, max_width, max_height),
+                                    lambda: _render_png([[(self.data, title, max_width, max_height)]], (4, 4), opaque=True))
+
+        plt = _plt()
         created_fig = ax is None
         if created_fig: fig, ax = plt.subplots(figsize=(4, 4))
         else: fig = ax.figure
 
-        max_width = self.shape[1] if max_width is None else max_width
-        max_height = self.shape[0] if max_height is None else max_height
-
         self._setup_ax(ax, max_width, max_height, title)
         self._draw_grid(ax, max_width, max_height)
 
@@ -78,7 +142,7 @@ class ArcGrid:
             return None
         return ax
 
-    def _setup_ax(self, ax: plt.Axes, max_width: int, max_height: int, title: Optional[str] = None) -> None:
+    def _setup_ax(self, ax: 'plt.Axes', max_width: int, max_height: int, title: Optional[str] = None) -> None:
         """Set up a matplotlib axis for grid plotting"""
         ax.set_xlim(0, max_width)
         ax.set_ylim(max_height, 0)
@@ -93,8 +157,9 @@ class ArcGrid:
         for spine in ax.spines.values():
             spine.set_visible(False)
 
-    def _draw_grid(self, ax: plt.Axes, max_width: int, max_height: int) -> None:
+    def _draw_grid(self, ax: 'plt.Axes', max_width: int, max_height: int) -> None:
         """Draw the grid cells and lines"""
+        plt = _plt()
         # Draw cells
         for row in range(self.shape[0]):
             for col in range(self.shape[1]):
@@ -112,12 +177,156 @@ class ArcGrid:
             ax.axhline(y, color='w', linewidth=1.5,
                        xmin=0, xmax=self.shape[1]/max_width)
 
-# %% ../nbs/00_task.ipynb 12
+# %% ../nbs/00_task.ipynb 11
+def _rgba(*colors) -> np.ndarray:
+    "Pack (r, g, b, a) tuples into uint32 pixels, so filling an area is one write per pixel"
+    return np.array(colors, np.uint8).view(np.uint32).ravel()
+
+_palette = _rgba((0, 0, 0, 255), (0, 0, 255, 255), (255, 0, 0, 255), (0, 128, 0, 255), (255, 255, 0, 255),
+                 (128, 128, 128, 255), (255, 192, 203, 255), (255, 165, 0, 255), (0, 255, 255, 255), (165, 42, 42, 255))
+_white, _black, _clear = _rgba((255, 255, 255, 255), (0, 0, 0, 255), (255, 255, 255, 0))
+_font = np.unpackbits(np.frombuffer(base64.b64decode(
+    'AAAAAAAAAAAAAAYYYYAYAAAAAUUUAAAAAAAUU+UU+UUAAIey8eG28IAAA4q8IeqOAAAAAcwY+s+AAAAMIQAAAAAAAAEIYYYY'
+    'IEAAAQIMMMMIQAAAI8YkAAAAAAAAII+IIAAAAAAAAAAAMIQAAAAA+AAAAAAAAAAAAAYAAAACCEEIIQQAAAc22222cAAAAM8M'
+    'MMM/AAAAc2GMY2+AAAAc2GcG2cAAAAGOW2/GGAAAA+w82Gm8AAAAc2w822cAAAA+2GMMYYAAAAc22c22cAAAAc22eG2cAAAA'
+    'AAAYAAYAAAAAAAYAAYQgAAAMYwYMAAAAAAA8A8AAAAAAAYMGMYAAAAAAcmMYAYAAAAcymqqnwcAAAA8cU+23AAAAA828228A'
+    'AAAAe2ww2cAAAAA822228AAAAA+w8w2+AAAAA+w8ww4AAAAAc2w+2eAAAAA32+223AAAAA8YYYY8AAAAAeMMss4AAAAA2048'
+    '27AAAAA4www2+AAAAAi22+qqAAAAA36622yAAAAAc2222cAAAAA8228w4AAAAAc2222cGAAAA822827AAAAAey8Om8AAAAA+'
+    'aYYY8AAAAA32222cAAAAA32UccIAAAAArqq+cUAAAAAzeMMezAAAAAzzeMMeAAAAA+2MY2+AAAAcYYYYYYcAAAggQQIIEEAA'
+    'AcMMMMMMcAAAIc2AAAAAAAAAAAAAAAA/AAYIEAAAAAAAAAAc2e2/AAAAww82228AAAAAAc2w2cAAAAOGe222fAAAAAAc2+we'
+    'AAAAOY+YYY+AAAAAAb222eG8AAww82222AAAAMA8MMM/AAAAMA8MMMMM4AAww28483AAAA8MMMMM/AAAAAA8+qqqAAAAAAs2'
+    '222AAAAAAc222cAAAAAA82228w4AAAAb222eGPAAAA3dYY8AAAAAAe4eH+AAAAYY+YYbOAAAAAA2222fAAAAAA22ccIAAAAA'
+    'Arq+eUAAAAAA7eMe3AAAAAA322UcYwAAAA+sY2+AAAAGMMYMMMGAAAAIIIIIIIAAAwYYMYYYwAAAAAasAAAAAA=='
+), np.uint8))[:95 * 11 * 6].reshape(95, 11, 6).astype(bool)  # 6x11 glyphs for ASCII 32–126
+
+def _text_mask(text: str, scale: int = 2) -> np.ndarray:
+    "Boolean mask of `text` rendered in the bitmap font (unknown characters render as '?')"
+    idx = [ord(ch) - 32 if 32 <= ord(ch) < 127 else ord('?') - 32 for ch in text]
+    mask = np.hstack(_font[idx]) if idx else np.zeros((11, 0), bool)
+    ink = np.flatnonzero(mask.any(1))
+    if len(ink): mask = mask[ink[0]:ink[-1] + 1]
+    return mask.repeat(scale, 0).repeat(scale, 1)
+
+def _encode_png(img: np.ndarray  # (h, w, 4) uint8 RGBA image
+               ) -> bytes:
+    "Encode an RGBA image as a PNG"
+    def chunk(tag, data): return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+    h, w = img.shape[:2]
+    rows = img.reshape(h, -1)
+    # Every row uses the PNG "Up" filter (difference from the row above), which suits blocks of flat colour
+    up = np.diff(rows, axis=0, prepend=np.zeros((1, rows.shape[1]), np.uint8))
+    raw = np.hstack([np.full((h, 1), 2, np.uint8), up]).tobytes()
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(raw, 6)) + chunk(b'IEND', b''))
+
+def _render_png(rows: list,  # Rows of panels, each a (2d array, title, max_width, max_height) tuple
+                figsize: tuple,  # Figure size in inches, as passed to matplotlib
+                separator: bool = False,  # Draw a vertical line between the two panels of a pair?
+                opaque: bool = False,  # White background (otherwise transparent)
+               ) -> bytes:
+    "Rasterize grids with numpy in the same layout as the matplotlib plots (at 100 dpi, tightly cropped)"
+    fig_w, fig_h = figsize[0] * 100, figsize[1] * 100
+    img = np.full((int(fig_h), int(fig_w)), _white if opaque else _clear)
+    # Default subplot margins, with `wspace=0.3` between panels and `hspace=0.15` between rows
+    n, m = len(rows), len(rows[0])
+    left, top = 0.125 * fig_w, 0.12 * fig_h
+    slot_w, slot_h = 0.775 * fig_w / (m + 0.3 * (m - 1)), 0.77 * fig_h / (n + 0.15 * (n - 1))
+    boxes = []  # (x0, y0, x1, y1) of everything drawn, for the tight crop
+
+    for r, row in enumerate(rows):
+        axes = []
+        for c, (data, title, max_w, max_h) in enumerate(row):
+            h, w = data.shape
+            size = min(slot_w / max_w, slot_h / max_h)
+            x0 = left + c * 1.3 * slot_w + (slot_w - max_w * size) / 2
+            y0 = top + r * 1.15 * slot_h + (slot_h - max_h * size) / 2
+            axes.append((x0, x0 + max_w * size))
+            boxes.append((x0, y0, x0 + max_w * size, y0 + max_h * size))
+            # Cells: map each pixel centre back to the cell it falls in
+            rx, ry = slice(round(x0), round(x0 + w * size)), slice(round(y0), round(y0 + h * size))
+            cols = np.minimum(((np.arange(rx.start, rx.stop) + 0.5 - x0) / size).astype(int), w - 1)
+            rws = np.minimum(((np.arange(ry.start, ry.stop) + 0.5 - y0) / size).astype(int), h - 1)
+            img[ry, rx] = _palette[data[np.ix_(rws, cols)]]
+            # 1.5pt white gridlines centred on cell boundaries, clipped to the axes
+            xb, yb = round(x0 + max_w * size), round(y0 + max_h * size)
+            for x in x0 + size * np.arange(w + 1):
+                img[ry, max(round(x - 1), rx.start):min(round(x + 1), xb)] = _white
+            for y in y0 + size * np.arange(h + 1):
+                img[max(round(y - 1), ry.start):min(round(y + 1), yb), rx] = _white
+            if title:
+                mask = _text_mask(title)
+                tx, ty = round(x0 + max_w * size / 2 - mask.shape[1] / 2), round(y0 - 8 - mask.shape[0])
+                img[ty:ty + mask.shape[0], tx:tx + mask.shape[1]][mask] = _black
+                boxes.append((tx, ty, tx + mask.shape[1], ty + mask.shape[0]))
+        if separator and len(axes) == 2:
+            x = round((axes[0][1] + axes[1][0]) / 2)
+            img[round(0.2 * fig_h):round(0.8 * fig_h), x] = _black
+            boxes.append((x, 0.2 * fig_h, x + 1, 0.8 * fig_h))
+
+    # Crop to the drawn content plus matplotlib's 0.1in `bbox_inches='tight'` padding
+    x0, y0 = (max(0, round(min(b[i] for b in boxes)) - 10) for i in (0, 1))
+    x1, y1 = (round(max(b[i] for b in boxes)) + 10 for i in (2, 3))
+    img = img[y0:y1, x0:x1]
+    return _encode_png(img.view(np.uint8).reshape(*img.shape, 4))
+
+# %% ../nbs/00_task.ipynb 13
+class RenderCache(LRUCache):
+    "Bounded LRU of rendered PNGs and their base64 encodings, keyed by grid fingerprints and plot parameters"
+    def __init__(self,
+                 maxsize: int = 256  # Maximum number of images to keep
+                ):
+        super().__init__(maxsize, on_evict=lambda key, entry: self._keys.pop(id(entry[0]), None))
+        self._keys = {}  # id(png) -> key, so `b64` can find the entry for a PNG this cache returned
+
+    def png(self, key: tuple, render: Callable[[], bytes]) -> bytes:
+        "PNG bytes for `key`, calling `render` only on a miss"
+        entry = self.get_or_create(key, lambda: [render(), None])  # [png, base64 string or None]
+        self._keys[id(entry[0])] = key
+        return entry[0]
+
+    def b64(self, png: bytes) -> str:
+        "Base64 encoding of `png`, computed once for PNGs returned by this cache"
+        entry = self.get(self._keys.get(id(png)))
+        if entry is None or entry[0] is not png: return base64.b64encode(png).decode()
+        if entry[1] is None: entry[1] = base64.b64encode(png).decode()
+        return entry[1]
+
+    def clear(self):
+        super().clear()
+        self._keys.clear()
+
+render_cache = RenderCache()
+
+# %% ../nbs/00_task.ipynb 19
 @patch
 def __eq__(self: ArcGrid, other: ArcGrid) -> bool:
-    return np.array_equal(self.data, other.data)
+    if not isinstance(other, ArcGrid): return NotImplemented
+    # Differing fingerprints settle inequality without touching the cells
+    return self is other or (self.fingerprint == other.fingerprint and self.bytes == other.bytes)
+
+# %% ../nbs/00_task.ipynb 26
+def pack_grids(grids: list  # `ArcGrid`s or 2d integer arrays with values 0–9
+              ) -> bytes:
+    "Pack grids into one buffer: a grid count, an (offset, height, width) table, then all cells as uint8"
+    arrays = [np.asarray(g.data if isinstance(g, ArcGrid) else g) for g in grids]
+    table = np.zeros((len(arrays), 3), dtype=np.int64)
+    offset = 0
+    for i, a in enumerate(arrays):
+        table[i] = (offset, *a.shape)
+        offset += a.size
+    cells = np.concatenate([a.astype(np.uint8).ravel() for a in arrays]) if arrays else np.zeros(0, np.uint8)
+    return np.int64(len(arrays)).tobytes() + table.tobytes() + cells.tobytes()
+
+def unpack_grids(buf  # Buffer written by `pack_grids` (e.g. `bytes` or a shared-memory `memoryview`)
+                ) -> list:
+    "Zero-copy uint8 views of the grids packed in `buf`"
+    n = int(np.frombuffer(buf, np.int64, 1)[0])
+    table = np.frombuffer(buf, np.int64, 3 * n, offset=8).reshape(n, 3)
+    start = 8 + table.nbytes
+    return [np.frombuffer(buf, np.uint8, h * w, offset=start + o).reshape(h, w) if h * w else np.zeros((h, w), np.uint8)
+            for o, h, w in table.tolist()]
 
-# %% ../nbs/00_task.ipynb 14
+# %% ../nbs/00_task.ipynb 28
 class ArcPair:
     "A pair of ARC grids, typically [input, output]. Can also be used for [output, prediction]"
     def __init__(self,
@@ -153,11 +362,17 @@ class ArcPair:
     def plot(self,
             titles: List[str] = ['Input', 'Output'],
             same_scale: bool = True,
-            fig: Optional[plt.Figure] = None,
-            subplot_spec: Optional[GridSpec] = None,
+            fig: Optional['plt.Figure'] = None,
+            subplot_spec: Optional['GridSpec'] = None,
             to_base64: bool = False,
-            **kwargs) -> Union[None, Tuple[plt.Figure, List[plt.Axes]], str]:
+            fast: bool = True,
+            **kwargs) -> Union[None, Tuple['plt.Figure', List['plt.Axes']], str]:
         """Plot the input-output pair side by side"""
+        if fig is None and to_base64 and fast and not kwargs:
+            return render_cache.png(('pair', self.input.fingerprint, self.output.fingerprint, tuple(titles), same_scale),
+                                    lambda: _render_png([self._panels(titles, same_scale)], (8, 4), separator=True))
+        from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
+        plt = _plt()
         if same_scale:
             max_width = max(self.input.shape[1], self.output.shape[1])
             max_height = max(self.input.shape[0], self.output.shape[0])
@@ -199,9 +414,15 @@ class ArcPair:
     
         return fig, axes
 
+    def _panels(self, titles: List[str], same_scale: bool) -> list:
+        """The (data, title, max_width, max_height) panels `_render_png` draws for this pair"""
+        max_width, max_height = (max(g.shape[1] for g in self), max(g.shape[0] for g in self)) if same_scale else (None, None)
+        return [(g.data, t, max_width or g.shape[1], max_height or g.shape[0]) for g, t in zip(self, titles)]
+
     @staticmethod
-    def _create_separator(fig: plt.Figure, bbox1: Bbox, bbox2: Bbox) -> None:
+    def _create_separator(fig: 'plt.Figure', bbox1: 'Bbox', bbox2: 'Bbox') -> None:
         """Create a separator line between two subplots"""
+        plt = _plt()
         middle_x = (bbox1.x1 + bbox2.x0) / 2
         line = plt.Line2D([middle_x, middle_x], [0.2, 0.8],
                          transform=fig.transFigure,
@@ -209,7 +430,7 @@ class ArcPair:
                          linewidth=1)
         fig.add_artist(line)
 
-# %% ../nbs/00_task.ipynb 18
+# %% ../nbs/00_task.ipynb 32
 class ArcTask:
     "An ARC task"
     def __init__(self,
@@ -227,11 +448,26 @@ class ArcTask:
         self.task_id, self.split, self.data_dir = task_id, split, Path(data_dir)
         self.train, self.test = self._load_data()
 
+    @classmethod
+    def from_examples(cls,
+                      task_id: str,  # 8-digit task id
+                      train: list,  # Training examples as `ArcPair`s
+                      test: list,  # Test examples as `ArcPair`s
+                      split: str = 'train',  # ARC public dataset split ('train' or 'eval')
+                      data_dir: str|Path|None = None  # Where the examples were loaded from, if anywhere
+                     ) -> 'ArcTask':
+        "Build a task from examples that are already loaded"
+        task = cls.__new__(cls)
+        task.task_id, task.split, task.data_dir = task_id, split, data_dir and Path(data_dir)
+        task.train, task.test = train, test
+        return task
+
     def _load_data(self):
         with open(self.data_dir / f"{self.task_id}.json", 'r') as f:
             task_data = json.load(f)
         
-        return ([ArcPair(np.array(example['input']), np.array(example['output']))
+        # Interned, so identical grids (including matching predictions) share one object
+        return ([ArcPair(ArcGrid.intern(np.array(example['input'])), ArcGrid.intern(np.array(example['output'])))
                  for example in task_data[split]]
                 for split in ('train', 'test'))
     
@@ -244,6 +480,7 @@ class ArcTask:
     def plot(self,
              same_scale: bool = True,
              to_base64: bool = False,
+             fast: bool = True,  # Render `to_base64` images with the numpy rasterizer (matplotlib is used if savefig `kwargs` are given)
              **kwargs) -> Union[None, str]:
         """Plot all training examples in the task"""
         n_examples = len(self.train)
@@ -251,6 +488,14 @@ class ArcTask:
         if n_examples == 0:
             print("No training examples available")
             return None
+
+        if to_base64 and fast and not kwargs:
+            key = ('task', *(g.fingerprint for pair in self.train for g in pair), same_scale)
+            return render_cache.png(key, lambda: _render_png(
+                [pair._panels([f'Example {i+1} Input', f'Example {i+1} Output'], same_scale)
+                 for i, pair in enumerate(self.train)], (8, 4 * n_examples)))
+        from matplotlib.gridspec import GridSpec
+        plt = _plt()
     
         # Fixed width, height scales with number of examples
         fig_width = 8  # Fixed width
@@ -285,7 +530,7 @@ class ArcTask:
             plt.show()
             return None
 
-# %% ../nbs/00_task.ipynb 25
+# %% ../nbs/00_task.ipynb 41
 def get_task_files(split: str  # 'train' or 'eval'
                   ) -> list[str]:
     "Get list of files from either training or evaluation data."
@@ -294,6 +539,114 @@ def get_task_files(split: str  # 'train' or 'eval'
     data_path = pkg_files / "arc_data" / "data" / data_split
     return [f.split('.json')[0] for f in os.listdir(data_path)]
 
-# %% ../nbs/00_task.ipynb 26
-train_tasks = get_task_files('train')
-eval_tasks = get_task_files('eval')
+# %% ../nbs/00_task.ipynb 42
+class TaskRegistry:
+    "Task ids per split, resolved on first access, plus an LRU of loaded `ArcTask`s"
+    def __init__(self,
+                 maxsize: int = 256  # Maximum number of loaded tasks to keep
+                ):
+        self._ids, self._tasks = {}, LRUCache(maxsize)
+
+    def task_ids(self, split: str  # 'train' or 'eval'
+                ) -> list[str]:
+        "Ids of the tasks in `split` (the data directory is only listed once)"
+        if split not in self._ids: self._ids[split] = get_task_files(split)
+        return self._ids[split]
+
+    def get(self,
+            task_id: str,  # 8-digit task id
+            split: str = 'train',  # ARC public dataset split ('train' or 'eval')
+            data_dir: str|Path|None = None  # Path to ARC data directory
+           ) -> ArcTask:
+        "Load a task, reusing the cached `ArcTask` if it was loaded recently"
+        return self._tasks.get_or_create((task_id, split, data_dir and str(data_dir)), lambda: ArcTask(task_id, split, data_dir))
+
+    def clear(self):
+        "Forget cached task ids and tasks"
+        self._ids = {}
+        self._tasks.clear()
+
+    def __len__(self): return len(self._tasks)
+    def __repr__(self): return f"TaskRegistry(tasks={len(self)}, maxsize={self._tasks.maxsize})"
+
+registry = TaskRegistry()
+
+# %% ../nbs/00_task.ipynb 43
+class _TaskIds(Sequence):
+    "Ids of the tasks in a split, listed through `registry` the first time they are used"
+    def __init__(self, split: str): self.split = split
+    def __getitem__(self, i): return registry.task_ids(self.split)[i]
+    def __len__(self): return len(registry.task_ids(self.split))
+    def __iter__(self): return iter(registry.task_ids(self.split))
+    def __repr__(self): return repr(registry.task_ids(self.split))
+
+# Exported (so star imports bind them) without listing the data directories on import
+train_tasks = _TaskIds('train')
+eval_tasks = _TaskIds('eval')
+
+# %% ../nbs/00_task.ipynb 50
+_corpus_header = np.dtype([('magic', 'S8'), ('split', 'S8'), ('n_tasks', '<i8')])
+_corpus_index = np.dtype([('task_id', 'S16'), ('n_train', '<i8'), ('n_test', '<i8'), ('first', '<i8')])
+
+def _corpus_cache_path(data_dir: Path) -> Path:
+    "Default location of a packed split: the user's cache directory, never the (possibly read-only) package directory"
+    cache = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'arcsolver'
+    # Different data directories can share a name (e.g. 'training'), so the file name also hashes the full path
+    digest = hashlib.blake2b(str(data_dir.resolve()).encode(), digest_size=4).hexdigest()
+    return cache / f"{data_dir.name}-{digest}.arcpack"
+
+def pack_corpus(split: str = 'train',  # 'train' or 'eval'
+                path: str|Path|None = None,  # Output file (defaults to `~/.cache/arcsolver/<data_dir name>-<hash>.arcpack`)
+                data_dir: str|Path|None = None  # Directory of task JSON files (defaults to the packaged split)
+               ) -> Path:
+    "Pack every task in an ARC split into one binary file that `PackedCorpus` can memory-map"
+    if data_dir is None:
+        data_split = 'training' if split == 'train' else 'evaluation'
+        data_dir = resources.files("arcsolver") / "arc_data" / "data" / data_split
+    data_dir = Path(data_dir)
+    path = Path(path) if path is not None else _corpus_cache_path(data_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    task_ids = sorted(f.stem for f in data_dir.glob('*.json'))
+    index = np.zeros(len(task_ids), dtype=_corpus_index)
+    grids = []
+    for i, task_id in enumerate(task_ids):
+        task = ArcTask(task_id, split, data_dir)
+        index[i] = (task_id.encode(), len(task.train), len(task.test), len(grids))
+        grids += [g for pair in task.train + task.test for g in pair]
+
+    header = np.array((b'ARCPACK1', split.encode(), len(task_ids)), dtype=_corpus_header)
+    path.write_bytes(header.tobytes() + index.tobytes() + pack_grids(grids))
+    return path
+
+# %% ../nbs/00_task.ipynb 52
+class PackedCorpus:
+    "A memory-mapped ARC split written by `pack_corpus`"
+    def __init__(self,
+                 path: str|Path  # File written by `pack_corpus`
+                ):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mmap)
+        header = np.frombuffer(buf, _corpus_header, 1)[0]
+        if header['magic'] != b'ARCPACK1': raise ValueError(f"{self.path} is not a packed ARC corpus")
+        self.split = header['split'].decode()
+        self.index = np.frombuffer(buf, _corpus_index, int(header['n_tasks']), offset=_corpus_header.itemsize)
+        self._grids = unpack_grids(buf[_corpus_header.itemsize + self.index.nbytes:])
+        self._rows = {task_id.decode(): i for i, task_id in enumerate(self.index['task_id'])}
+
+    @property
+    def task_ids(self) -> list[str]: return list(self._rows)
+
+    def __len__(self): return len(self._rows)
+    def __contains__(self, task_id): return task_id in self._rows
+    def __iter__(self): return (self[task_id] for task_id in self._rows)
+    def __repr__(self): return f"PackedCorpus(path='{self.path}', split='{self.split}', tasks={len(self)})"
+
+    def __getitem__(self, task_id: str) -> ArcTask:
+        "Build the `ArcTask` for `task_id` from views of the mapped grids"
+        _, n_train, n_test, first = self.index[self._rows[task_id]].tolist()
+        grids = [ArcGrid.trusted(g) for g in self._grids[first:first + 2 * (n_train + n_test)]]
+        pairs = [ArcPair(grids[i], grids[i + 1]) for i in range(0, len(grids), 2)]
+        return ArcTask.from_examples(task_id, pairs[:n_train], pairs[n_train:], self.split, self.path)
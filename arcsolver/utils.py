@@ -1,12 +1,15 @@
-"""an xml parsing util"""
+"""xml parsing and caching utils"""
 
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_utils.ipynb.
 
 # %% auto 0
-__all__ = ['parse_from_xml']
+__all__ = ['parse_from_xml', 'LRUCache']
 
 # %% ../nbs/04_utils.ipynb 3
 import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
 
 # %% ../nbs/04_utils.ipynb 4
 class TagNotFoundError(Exception):
@@ -63,3 +66,58 @@ def parse_from_xml(input_text: str, tag_name: str) -> str:
 
     return content
 
+
+# %% ../nbs/04_utils.ipynb 7
+class LRUCache:
+    "Thread-safe bounded LRU mapping that counts the hits and misses of `get_or_create`"
+    def __init__(self,
+                 maxsize: int = 128,  # Maximum number of entries to keep (0 disables caching)
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None  # Called with each evicted key and value
+                ):
+        self.maxsize, self.on_evict, self.hits, self.misses = maxsize, on_evict, 0, 0
+        self._entries, self._lock = OrderedDict(), threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        "Value stored under `key` (marking it as recently used), or `default`"
+        with self._lock:
+            if key not in self._entries: return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        "Store `value` under `key`, evicting the least recently used entries beyond `maxsize`"
+        with self._lock:
+            if self.maxsize == 0: return value
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+        return value
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        "Value stored under `key`, calling `create` (outside the lock) only on a miss"
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self.misses += 1
+        value = create()
+        with self._lock:
+            if self.maxsize == 0: return value
+            # Another thread may have created the same entry meanwhile; keep the first, so callers share one value
+            value = self._entries.setdefault(key, value)
+            self._evict()
+        return value
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            key, value = self._entries.popitem(last=False)
+            if self.on_evict is not None: self.on_evict(key, value)
+
+    def clear(self):
+        "Drop every entry (the hit and miss counts are kept)"
+        with self._lock: self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool: return key in self._entries
+    def __len__(self) -> int: return len(self._entries)
+    def __repr__(self): return f"{type(self).__name__}(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"